@@ -0,0 +1,10 @@
+'''
+asyncio interface for rounding batches & streams of numbers without blocking the event loop,
+with the work done chunk by chunk in a thread or process pool executor (see round_many_async() & round_iter_async())
+
+Key usage examples:
+    from sigfig import aio
+    results, status = await aio.round_many(values, sigfigs=3)
+    async for result in aio.round_iter(values, uncertainties, format='Drake'): ...
+'''
+from .sigfig import round_many_async as round_many, round_iter_async as round_iter
@@ -1,14 +1,19 @@
 ﻿#!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-from decimal import Decimal
-from copy import deepcopy
-from sortedcontainers import SortedDict
-from warnings import warn, filterwarnings, resetwarnings
+from decimal import Decimal, Context, InvalidOperation, ROUND_HALF_UP, MAX_PREC, MAX_EMAX, MIN_EMIN
+from collections import Counter, OrderedDict, namedtuple
+from enum import IntEnum
+from array import array
+from warnings import filterwarnings, resetwarnings
+import warnings
 
 import numbers
+import re
+import sys
+import _thread
+from contextvars import ContextVar
 
-from inspect import currentframe, getfile
 def _warn_stacklevel(best_guess=2):
     '''Helper function to associate warnings with caller outside this module.
 
@@ -18,20 +23,135 @@ def _warn_stacklevel(best_guess=2):
         integer stack level for warnings.warn() function.
 
     Note:
-    - Python 3.12 should simplify this process with 'skip_file_prefixes' once the path normalization bugs are fixed.
+    - frames are matched on the (cached) code filename of this module rather than inspect.getfile() & __file__
+    - sys._getframe() is used directly (as inspect.currentframe() does) so the inspect module isn't imported
+    - Python 3.12 should simplify this process with 'skip_file_prefixes' once it reliably skips frames (it doesn't in 3.12.1).
     '''
     stacklevel = 0
     try:
-        frame = currentframe()
+        frame = sys._getframe()
         while True:
-            if frame is None or getfile(frame) != __file__:
+            if frame is None or frame.f_code.co_filename != _module_file:
                 return stacklevel
             frame = frame.f_back
             stacklevel += 1
     except:
         return best_guess
+_module_file = _warn_stacklevel.__code__.co_filename
+
+class Diagnostics:
+    '''
+    Warnings withheld from Python's warnings module by the 'collect' & 'count' warning policies:
+        warnings: list of warning instances (eg. UserWarning('no number provided, assuming zero (0)'))
+        counts: collections.Counter of warning categories (eg. {UserWarning: 12})
+    '''
+    def __init__(self):
+        self.warnings = []
+        self.counts = Counter()
+    def clear(self):
+        self.warnings.clear()
+        self.counts.clear()
+    def __repr__(self):
+        return f'Diagnostics(warnings={self.warnings}, counts={dict(self.counts)})'
+
+class Status(IntEnum):
+    '''per element status codes returned by round_many()'''
+    OK = 0
+    INVALID = 1      # unparseable input (round() raises ValueError)
+    UNSUPPORTED = 2  # unsupported input type (round() raises TypeError)
+    NAN = 3          # not a number, returned unchanged
+    MISSING = 4      # no number given, rounded as zero
+    PRECISION = 5    # fewer significant figures given than requested, padded with zeros
+    WARNING = 6      # any other warning
+
+_warning_policies = ('default', 'collect', 'count', 'suppress')
+_diagnostics = Diagnostics()
+_warning_state = ContextVar('sigfig_warning_state', default=('default', _diagnostics))
+_status = ContextVar('sigfig_status', default=None)
+_local = _thread._local()
+def warn(message, category=UserWarning, stacklevel=1, status=Status.WARNING):
+    '''Helper function issuing warnings according to the active warning policy:
+        'default': warnings.warn() attributed to the first caller outside this module
+        'collect': appended to the active Diagnostics().warnings
+        'count': tallied by category in the active Diagnostics().counts
+        'suppress': dropped
+    Warnings are also tallied per thread (results of round() calls which issued warnings are never cached)
+    and the status of the first warning is recorded for each element of round_many()
+    '''
+    _local.warnings = getattr(_local, 'warnings', 0) + 1
+    if _status.get() == Status.OK:
+        _status.set(status)
+    policy, diagnostics = _warning_state.get()
+    if policy == 'default':
+        warnings.warn(message, category, _warn_stacklevel(stacklevel + 1))
+    elif policy == 'collect':
+        diagnostics.warnings.append(category(message))
+    elif policy == 'count':
+        diagnostics.counts[category] += 1
+
+def set_warning_policy(policy='default'):
+    '''
+    set how warnings are handled by the current thread or asyncio task (& tasks it then creates),
+    unless overridden by warning_policy() or the warn keyword argument:
+        'default': issued through Python's warnings module
+        'collect': appended to the returned Diagnostics().warnings list
+        'count': tallied by category in the returned Diagnostics().counts
+        'suppress': dropped
+    None of these policies inspect the call stack except for 'default'.
+
+    Key usage examples:
+        diagnostics = set_warning_policy('count')
+        round('12', sigfigs=5) => '12.000'
+        diagnostics.counts => Counter({<class 'UserWarning'>: 1})
+    '''
+    if policy not in _warning_policies:
+        raise ValueError(f'warning policy expected to be 1 of {_warning_policies}, got {policy!r}')
+    diagnostics = Diagnostics()
+    _warning_state.set((policy, diagnostics))
+    return diagnostics
+
+class warning_policy:
+    '''
+    context manager setting how warnings are handled by the current thread or asyncio task within the with block
+    (see set_warning_policy()), yielding a fresh Diagnostics() for the block.
+
+    Key usage examples:
+        with warning_policy('collect') as diagnostics:
+            round('12', sigfigs=5) => '12.000'
+        diagnostics.warnings => [UserWarning('5 significant figures requested from number with only 2 significant figures')]
+    '''
+    def __init__(self, policy):
+        if policy not in _warning_policies:
+            raise ValueError(f'warning policy expected to be 1 of {_warning_policies}, got {policy!r}')
+        self.policy = policy
+        self.diagnostics = Diagnostics()
+        self.tokens = []
+    def __enter__(self):
+        self.tokens.append(_warning_state.set((self.policy, self.diagnostics)))
+        return self.diagnostics
+    def __exit__(self, *exc_info):
+        _warning_state.reset(self.tokens.pop())
+
+def _call_policy(kwargs):
+    '''Private function for use only in round() function & Rounder class:
+    returns the warning policy given by the warn keyword argument, None if absent or a boolean
+    '''
+    if 'warn' in kwargs or 'warning' in kwargs or 'warnings' in kwargs:
+        warning = kwargs.get('warn') or kwargs.get('warning') or kwargs.get('warnings')
+        if type(warning) is str and warning in _warning_policies:
+            return warning
+    return None
+
+def _policy_call(policy, func, *args):
+    '''Private function for use only in round() function & Rounder class:
+    returns func(*args) with the current warning policy set to policy for the duration of the call
+    '''
+    token = _warning_state.set((policy, _warning_state.get()[1]))
+    try:
+        return func(*args)
+    finally:
+        _warning_state.reset(token)
 
-_manual_settings = {}
 _default_settings = {
     'spacing': 0.1,
     'spacer': '',
@@ -43,6 +163,57 @@ _default_settings = {
     'round_by_sigfigs': False,
     'round_by_decimals': True,
     'given_sigfigs': 0}
+_Settings = namedtuple('_Settings', list(_default_settings) + ['external_brackets', 'engine'])
+_settings = ContextVar('sigfig_settings', default=_Settings(**_default_settings, external_brackets=False, engine='number'))
+_settings_keys = {'format', 'style', 'notation', 'form', 'spacing', 'spacer', 'decimal', 'sep', 'separator', 'separation', 'cutoff', 'crop', 'prefix', 'engine'}
+_notations = {'sci', 'scientific', 'eng', 'engineering', 'std', 'standard'}
+_prefixes = {True, False, 'major', 'minor', 'sci', 'eng', 'all'}
+
+class settings:
+    '''
+    context manager setting the default options of round() within the with block, for the current thread
+    or asyncio task only, with nested blocks building upon the enclosing block's settings.
+    Accepts the keyword arguments of round() which describe the format rather than the number:
+    format/style/notation, spacing, spacer, decimal, sep, cutoff, prefix & engine.
+
+    Options are resolved once on entering the block into an immutable snapshot which is read by round()
+    with a single lookup.  Keyword arguments given to round() take precedence & the format options only apply
+    to output given as strings (ie. string input or rounding by uncertainty).
+    Options selecting the output type (eg. sep=tuple, format=float, format='map') are only accepted by round(),
+    while invalid options raise TypeError or ValueError rather than being ignored.
+
+    Key usage examples:
+        with settings(format='Drake'):
+            round('123456.789099', '-1.15E-4') => '123 456.789 10(12)'
+        with settings(spacer=','):
+            round('1234567.891', sigfigs=5) => '1,234,600'
+    '''
+    def __init__(self, **kwargs):
+        for key in kwargs:
+            if key not in _settings_keys:
+                raise TypeError(f'settings() got unexpected keyword argument {key!r}, expecting 1 of {sorted(_settings_keys)}')
+            val = kwargs[key]
+            if key in {'sep', 'separator', 'separation'} and val in (tuple, list, 'tuple', 'list'):
+                raise ValueError(f'settings() cannot select the output type, got {key}={val!r} (give it to round() instead)')
+            if key in {'format', 'style', 'notation', 'form'} and not (type(val) is str and (val in _formats or val in _notations or val == '+-')):
+                raise ValueError(f'settings() expects {key} to be 1 of {sorted(set(_formats) | _notations | {'+-'})}, got {val!r}')
+            if key in {'cutoff', 'crop'} and (type(val) is bool or not isinstance(val, numbers.Integral)):
+                raise TypeError(f'settings() expects {key} to be an integer, got {val!r}')
+            if key == 'prefix' and not (type(val) in (bool, str) and val in _prefixes):
+                raise ValueError(f'settings() expects prefix to be 1 of {_prefixes}, got {val!r}')
+            if key == 'engine' and not (type(val) is str and val in _engines):
+                raise ValueError(f'settings() expects engine to be 1 of {_engines}, got {val!r}')
+        self.kwargs = kwargs
+        self.tokens = []
+    def __enter__(self):
+        given = _options_parse(str, (), self.kwargs)
+        snapshot = _settings.get()._replace(**given['format'], separator=given['separator'], prefix=given['prefix'],
+                                            exponent=given['exponent'], cutoff=given['cutoff'], engine=given['engine'],
+                                            external_brackets='external_brackets' in given)
+        self.tokens.append(_settings.set(snapshot))
+        return self
+    def __exit__(self, *exc_info):
+        _settings.reset(self.tokens.pop())
 _major_prefixes = {
     24: ['Y', 'septillion'],
     21: ['Z', 'sextillion'],
@@ -66,15 +237,38 @@ _minor_prefixes = {
     1: ['da', 'ten'],
     -1: ['d', 'tenth'],
     -2: ['c', 'hundredth']}
+def _engineering_power(power):
+    '''Private function for use only in _Number.prefixify():
+    returns the multiple of 3 used as the engineering notation exponent of a number with the given highest 10's power
+    '''
+    return power // 3 * 3 if power >= 0 else -((2 - power) // 3) * 3
+_all_prefixes = {**_major_prefixes, **_minor_prefixes}
+_prefix_tables = {}
+def _prefix_table(prefix):
+    '''Private function for use only in _Number.prefixify():
+    returns the table (built on first use) mapping the 10's power of a number's highest (major prefixes)
+    or lowest ('all' prefixes) populated digit to (prefix, 10's power of prefix)
+    '''
+    table = _prefix_tables.get(prefix)
+    if table is None:
+        if prefix == 'all':
+            table = {p: (_all_prefixes[q][0], q) for p in range(-24, 25) for q in [max(q for q in _all_prefixes if q <= p)]}
+        else:
+            table = {p: (_major_prefixes[q][0], q) for p in range(-24, 28) for q in [min(_engineering_power(p), 24)]}
+        _prefix_tables[prefix] = table
+    return table
 
 class _Number:
     '''
     Private data structure for storing & manipulating numbers
 
     Attributes:
-        .map: - dict for number storage
-              - maps 10's power (key) to numeric value (value)
-              - i.e. 3.14 => .map = {0:3, -1: 1, -2: 4}
+        .digits:   - bytearray of ASCII digits from the highest to the lowest populated 10's power
+                   - i.e. 3.14 => .digits = bytearray(b'314')
+        .exponent: integer 10's power of the last (lowest) digit in .digits
+                   - i.e. 3.14 => .exponent = -2
+        .map:      read-only compatibility view mapping 10's power (key) to numeric value (value)
+                   - i.e. 3.14 => .map = {-2: 4, -1: 1, 0: 3}
     Attributes/Mehtods for inspection (getting values):
         .sign:     string of either '+' or '-', denoting sign of stored number
         .nan:      bool True/False depending on whether number is NaN
@@ -83,248 +277,389 @@ class _Number:
         .has_uncertainty: bool True/False depending on whether there is an associated uncertainty with this number
         .max_power(): returns integer corresponding to number's highest populated 10's power
         .min_power(): returns integer corresponding to number's lowest populated 10's power
+        .digit(int):  returns digit at given 10's power (None if not populated)
         .decimate(dict, _Number, bool, bool): returns string of all digits in given format
             specifying spacing and non-standard decimal point, optional sign
             optionally embedded uncertainty, and optional leading/trailing zeros
         .output(type): returns number in given type
+        .copy():       returns an independent copy (cheap, no deepcopy needed)
     Methods for manipulation (changing the value):
         .set_sign(str): function used to change/set the number's sign by passing '-' or '+'
                         so that .positive, .negative, .sign don't need manual updating
-        .increment_power_by(int): (de)increments all keys in .map by given value
+        .increment_power_by(int): (de)increments all 10's powers by given value
         .round_by_decimals(int):  performs rounding operation to the given 10's power
         .prefixify(str):          converts to Scientific or Engineering notation with optional SI prefix
     '''
+    __slots__ = ('digits', 'exponent', 'negative', 'prefix', 'has_uncertainty', 'zero', 'nan', 'nan_value')
     def __init__(self):
-        self.set_sign('+')
+        self.negative = False
         self.prefix = ''
         self.has_uncertainty = False
-        self.map = SortedDict()
+        self.digits = bytearray()
+        self.exponent = 0
         self.zero = False
         self.nan = False
+        self.nan_value = None
+    def copy(self):
+        '''returns an independent copy, only the digit buffer being mutable (also used by copy.copy() & copy.deepcopy())'''
+        number = _Number.__new__(_Number)
+        number.digits = self.digits[:]
+        number.exponent = self.exponent
+        number.negative = self.negative
+        number.prefix = self.prefix
+        number.has_uncertainty = self.has_uncertainty
+        number.zero = self.zero
+        number.nan = self.nan
+        number.nan_value = self.nan_value
+        return number
+    __copy__ = copy
+    def __deepcopy__(self, memo):
+        return self.copy()
+    @property
+    def sign(self):
+        return '-' if self.negative else '+'
+    @property
+    def positive(self):
+        return not self.negative
+    @property
+    def map(self):
+        if self.nan:
+            return {'NaN': self.nan_value}
+        return {self.exponent + i: d - 48 for i, d in enumerate(reversed(self.digits))}
     def set_sign(self, sign='+'):
         '''sets the number's sign'''
         if sign == '+':
             self.negative = False
-            self.positive = True
-            self.sign = '+'
         elif sign == '-':
             self.negative = True
-            self.positive = False
-            self.sign = '-'
         else:
-            warn('sign must be "+" or "-", assuming positive', stacklevel=_warn_stacklevel(4))
+            warn('sign must be "+" or "-", assuming positive', stacklevel=4)
             self.negative = False
-            self.positive = True
-            self.set_sign('+')
     def max_power(self):
         '''returns integer corresponding to number's highest populated 10's power'''
-        return max(self.map)
+        return self.exponent + len(self.digits) - 1
     def min_power(self):
         '''returns integer corresponding to number's lowest populated 10's power'''
-        return min(self.map)
+        return self.exponent
+    def digit(self, power):
+        '''returns integer digit at given 10's power, None if not populated'''
+        i = self.exponent + len(self.digits) - 1 - power
+        if 0 <= i < len(self.digits):
+            return self.digits[i] - 48
+        return None
     def increment_power_by(self, n):
-        '''(de)increments all keys in .map'''
-        tmp = SortedDict()
-        for key in self.map:
-            tmp[key + n] = self.map[key]
-        self.map = tmp
+        '''(de)increments all 10's powers'''
+        self.exponent += n
     def round_by_decimals(self, decimals):
         '''performs rounding operation to the given 10's power'''
         last_power = -decimals
-        tmp_map = SortedDict({self.max_power(): 0})
-        tmp_map = SortedDict({last_power: 0})
-        last_tmp_power = self.max_power()
-        for key in range(self.max_power(), min(-decimals - 1, -1), -1):
-            if key < last_power and key >= 0 or key not in self.map:
-                float(0)
-            #if key < last_power and key < 0:
-            #    Decimal(3)
-            #    continue
-            else:
-                last_tmp_power = key
-                tmp_map[key] = self.map[key]
-        if last_power == self.max_power() + 1:
-            if self.map[self.max_power()] >= 5:
-                tmp_map[last_power] = 1
+        top = self.max_power()
+        if last_power == top + 1:
+            if self.digits[0] >= 53:
+                self.digits[:] = b'1'
             else:
                 self.zero = True
-                tmp_map = SortedDict({last_power:0})
+                self.digits[:] = b'0'
                 self.set_sign('+')
-        elif last_power > self.max_power():
+            self.exponent = last_power
+        elif last_power > top:
             self.zero = True
-            tmp_map = SortedDict({last_power:0})
+            self.digits[:] = b'0'
+            self.exponent = last_power
             self.set_sign('+')
-        elif last_tmp_power - 1 in self.map and self.map[last_tmp_power - 1] >= 5:
-            tmp_map[last_tmp_power] += 1
-            tmp_power = last_tmp_power
-            while tmp_map[tmp_power] == 10:
-                tmp_map[tmp_power] = 0
-                tmp_power += 1
-                if tmp_power not in tmp_map:
-                    tmp_map[tmp_power] = 1
+        elif last_power <= self.exponent:
+            self.digits.extend(b'0' * (self.exponent - last_power))
+            self.exponent = last_power
+        else:
+            cut = len(self.digits) - (last_power - self.exponent)
+            carry = self.digits[cut] >= 53
+            del self.digits[cut:]
+            self.exponent = last_power
+            if carry:
+                nines = len(self.digits) - len(self.digits.rstrip(b'9'))
+                if nines:
+                    self.digits[-nines:] = b'0' * nines
+                if nines == len(self.digits):
+                    self.digits.insert(0, 49)
                 else:
-                    tmp_map[tmp_power] += 1
-        self.map = tmp_map
-        '''if self.map == SortedDict({0:0}):
-            self.zero = True
-            self.set_sign('+')
-            if self.has_uncertainty:
-                if last_power < 0:
-                    for p in range(-1, last_power - 1, -1):
-                        self.map[p] = 0
-                elif last_power > 0:
-                    self.map = SortedDict({last_power:0})'''
+                    self.digits[-nines - 1] += 1
     def decimate(self, format, unc=None, zeropadding=True, sign=True, units=''):
         '''
         returns string of all digits in given format {spacing, spacer, decimal},
         with unc=_Number for embedded uncertainty, and optional leading/trailing zeros & sign
+
+        rendered by the compiled _Formatter shared by all numbers of the same format
         '''
-        top = self.max_power()
-        bot = self.min_power()
-        if zeropadding:
-            top = max(top, 0)
-            bot = min(bot, 0)
-        if self.zero and not unc and top > 0:
-            top = 0
-        output = []
-        if sign and self.negative:
-            output.append('-')
-        for p in range(top, bot - 1, -1):
-            try:
-                output.append(str(self.map[p]))
-            except:
-                output.append('0')
-            if p == self.min_power() and unc:
-                output.append('('+unc.decimate(format, zeropadding=False, sign=False)+')')
-            if p != bot:
-                if p == 0:
-                    output.append(format['decimal'])
-                elif p % format['spacing'] == 0:
-                    output.append(format['spacer'])
-        return ''.join(output) + units
-    @staticmethod
-    def _int(num):
-        return int(float(num))
+        return _formatter(format).digits(self, unc, zeropadding, sign, units)
     def output(self, output_type):
         '''returns number in given type'''
-        no_formatting = {'decimal': '', 'spacer': '', 'spacing': 0.1}
-        num = self.decimate(no_formatting, zeropadding=False) or "0"
-        output_type = self._int if output_type == int else output_type
-        return output_type(f"{num}E{self.min_power()}")
+        if issubclass(output_type, (float, numbers.Integral)):
+            if len(self.digits) <= 15 and -22 <= self.exponent <= 22:
+                if self.exponent >= 0:
+                    value = float(int(self.digits) * _exact_powers[self.exponent])
+                else:
+                    value = int(self.digits) / _exact_powers[-self.exponent]
+                value = -value if self.negative else value
+            else:
+                value = float(f"{self.sign}{self.digits.decode()}E{self.exponent}")
+            return output_type(value) if issubclass(output_type, float) else output_type(int(value))
+        return output_type(f"{self.sign}{self.digits.decode()}E{self.exponent}")
     def __gt__(self, other):
         if self.max_power() > other.max_power():
             return True
         for p in range(self.max_power(), self.min_power() - 1, -1):
-            if p not in other.map:
-                if not self.map[p]:
+            theirs = other.digit(p)
+            mine = self.digit(p)
+            if theirs is None:
+                if not mine:
                     continue
                 return True
-            if self.map[p] > other.map[p]:
+            if mine > theirs:
                 return True
-            if self.map[p] < other.map[p]:
+            if mine < theirs:
                 return False
         if other.min_power() > self.min_power():
             return False
         return False
     def prefixify(self, prefix, exponent):
-        '''converts to Engineering/Scientific notation with optional SI prefix'''
-        #self.prefix = 'XXX'
-        #return None
-        self.prefix = ''
-        power_shift = 0
+        '''
+        converts to Engineering/Scientific notation with optional SI prefix
+
+        prefixes are looked up in tables keyed by 10's power, with the number of repeated Y/y prefixes
+        for magnitudes beyond their range counted directly, so the number is shifted only once
+        '''
         if prefix == 'sci':
             p = self.max_power()
             self.prefix = exponent + str(p)
-            self.increment_power_by(-p)
-            power_shift += -p
-            return power_shift
         elif prefix == 'eng':
-            p0 = 0
-            if self.max_power() < 0:
-                p0 = 2
-            p = int((self.max_power() - p0)/3)*3
+            p = _engineering_power(self.max_power())
             self.prefix = exponent + str(p)
-            self.increment_power_by(-p)
-            power_shift += -p
-            return power_shift
-        elif prefix in ['all', 'minor']:
-            prefixes = SortedDict(_major_prefixes+_minor_prefixes)
-            p = self.min_power()
-            while p >= min(prefixes):
-                if p in prefixes:
-                    break
-                p -= 1
         else:
-            #prefix in [True, 'major', 'eng']:
-            prefixes = _major_prefixes
-            #p = int((self.min_power()-1)/3)*3
-            p = self.max_power()
-            while p > max(prefixes)+3:
-                self.prefix += prefixes[max(prefixes)][0]
-                self.increment_power_by(-max(prefixes))
-                power_shift += -max(prefixes)
-                p -= max(prefixes)
-            while p < min(prefixes):
-                self.prefix += prefixes[min(prefixes)][0]
-                self.increment_power_by(-min(prefixes))
-                power_shift += -min(prefixes)
-                p -= min(prefixes)
-            p0 = 0
-            if self.max_power() < 0:
-                p0 = 2
-            p = int((self.max_power() - p0)/3)*3
-        self.prefix = prefixes[p][0] + self.prefix
+            offset = 0
+            stacked = ''
+            if prefix == 'all':
+                p = self.exponent if self.exponent < 24 else 24
+                table = _prefix_table('all')
+            else:
+                #prefix in [True, 'major']:
+                p = self.max_power()
+                table = _prefix_table('major')
+                if p > 27:
+                    repeats = (p - 4) // 24
+                    stacked = 'Y' * repeats
+                    offset = 24 * repeats
+            if p < -24:
+                repeats = (-1 - p) // 24
+                stacked = 'y' * repeats
+                offset = -24 * repeats
+            symbol, power = table[p - offset]
+            self.prefix = symbol + stacked
+            p = offset + power
         self.increment_power_by(-p)
-        power_shift += -p
-        return power_shift
+        return -p
+
+class _Formatter:
+    '''
+    Private class for use only in _Number.decimate() & _output() functions:
+    A digit format {spacing, spacer, decimal} along with the uncertainty separator, bracket mode & prefix style
+    compiled once into digit group sizes & joiners, so numbers are rendered from their digit buffer
+    by slicing out whole groups & joining them rather than by examining each digit.
+
+    Compiled formatters are shared through _formatter().
+    '''
+    __slots__ = ('spacing', 'spacer', 'decimal', 'separator', 'brackets', 'external', 'prefix', 'inline_prefix', 'wrap')
+    def __init__(self, format, separator=' ± ', prefix=False, external_brackets=False):
+        spacing = format['spacing']
+        self.spacing = abs(int(spacing)) if spacing == int(spacing) and spacing else 0
+        self.spacer = format['spacer']
+        self.decimal = format['decimal']
+        self.separator = separator
+        self.brackets = separator == 'brackets'
+        self.external = external_brackets
+        self.prefix = prefix
+        self.inline_prefix = bool(prefix) and prefix not in {True, 'major', 'minor', 'all'}
+        self.wrap = prefix == True
+    def group(self, digits, top, bot):
+        '''returns digits (spanning 10's powers top to bot) joined into spacer separated groups around the decimal'''
+        n = self.spacing
+        if not n:
+            if bot < 0 <= top:
+                return digits[:top + 1] + self.decimal + digits[top + 1:]
+            return digits
+        first = top % n + 1
+        if len(digits) <= first:
+            return digits
+        groups = [digits[:first]] + [digits[i:i + n] for i in range(first, len(digits), n)]
+        if bot < 0 <= top:
+            point = top // n + 1
+            return self.spacer.join(groups[:point]) + self.decimal + self.spacer.join(groups[point:])
+        return self.spacer.join(groups)
+    def digits(self, num, unc=None, zeropadding=True, sign=True, units=''):
+        '''returns string of all digits of num, see _Number.decimate()'''
+        last = num.exponent
+        digits = num.digits.decode()
+        first = last + len(digits) - 1
+        top = first
+        bot = last
+        if zeropadding:
+            if top < 0:
+                top = 0
+            if bot > 0:
+                bot = 0
+        if top > 0 and num.zero and not unc:
+            top = 0
+        if bot < last:
+            digits += '0' * (last - bot)
+        if top > first:
+            digits = '0' * (top - first) + digits
+        elif top < first:
+            digits = digits[first - top:]
+        if unc:
+            split = top - last + 1
+            if last == 0 and bot < 0:
+                joiner = self.decimal
+            elif self.spacing and last % self.spacing == 0 and bot < last:
+                joiner = self.spacer
+            else:
+                joiner = ''
+            output = (self.group(digits[:split], top, last) + '(' + self.digits(unc, zeropadding=False, sign=False) + ')'
+                      + joiner + self.group(digits[split:], last - 1, bot))
+        else:
+            output = self.group(digits, top, bot)
+        if sign and num.negative:
+            return '-' + output + units
+        return output + units
+    def __call__(self, num, unc=None, output=None):
+        '''returns the rounded number (& uncertainty) as a formatted string, or list/tuple of strings'''
+        if unc is not None and self.brackets and unc.exponent > 0 and not self.external:
+            return self.digits(num, unc=unc)
+        text = self.digits(num)
+        units = num.prefix if self.prefix else ''
+        if output in {list, tuple}:
+            if unc is not None:
+                return output([text + units, self.digits(unc, sign=False, units=units)])
+            return output([text + units])
+        if unc is not None:
+            if self.brackets and unc.exponent > 0:
+                text += '(' + self.digits(unc, sign=False) + ')'
+            elif self.brackets:
+                text += '(' + self.digits(unc, zeropadding=False, sign=False) + ')'
+            else:
+                if self.inline_prefix:
+                    text += num.prefix
+                text += self.separator + self.digits(unc, sign=False)
+                if self.wrap and units:
+                    text = f'({text})'
+        return text + units
+
+_formatters = {}
+def _formatter(format, separator=' ± ', prefix=False, external_brackets=False):
+    '''Private function for use only in _options_parse() function & _Number.decimate():
+    returns the compiled _Formatter for the given format & options, compiling it on first use
+    '''
+    key = (format['spacing'], format['spacer'], format['decimal'], separator, prefix, external_brackets)
+    try:
+        return _formatters[key]
+    except TypeError:
+        return _Formatter(format, separator, prefix, external_brackets)
+    except KeyError:
+        if len(_formatters) >= 256:
+            _formatters.clear()
+        formatter = _formatters[key] = _Formatter(format, separator, prefix, external_brackets)
+        return formatter
 
+_types = (numbers.Number, str, Decimal, _Number, type(None))
+_formats = {'English': [3, ',', '.', ' ± ', 9, False,  '#,###,###.## ± 0.#'],
+            'French':  [3, ' ', ',', ' ± ', 99, False, '# ### ###,## ± 0,##'],
+            'other':   [3, '.', ',', ' ± ', 99, False, '#.###.###,## ± 0,##'],
+            'PDG':     [.1, '', '.', ' ± ', 35, False,  '# ### ###.##(##)'],
+            'Drake':   [3, ' ', '.', 'brackets', 29, False, '# ### ###.##(##)'],
+            'sci':     [.1, '', '.', ' ± ', 9, 'sci', '# ### ###.##(##)'],
+            'eng':     [.1, '', '.', ' ± ', 9, 'eng', '# ### ###.##(##)'],
+            'std':     [.1, '', '.', ' ± ', 9, False, '# ### ###.##(##)']}
 def _arguments_parse(args, kwargs):
     '''Private function for use only in round() function:
     Deciphers user intent based on given inputs along with preset defaults
     which returns actionable and summarized useful variables in a dict.
+    The numbers are parsed after the warnings argument & before the other options, so warnings are issued in that order.
+    '''
+    if not isinstance(args[0], _types):
+        raise TypeError(f'Invalid input type of {type(args[0])}, expecting 1 of {_types}')
+    given = _warnings_parse(kwargs)
+    engine = kwargs['engine'] if type(kwargs.get('engine')) is str and kwargs['engine'] in _engines else _settings.get().engine
+    positional = len(args) > 1 and type(args[1]) != int and args[1] == args[1]
+    numbers = _numbers_parse({'engine': engine, 'uncertainty': None} if positional else {'engine': engine}, args)
+    given = _options_parse(type(args[0]), args[1:], kwargs, given)
+    given['num'] = numbers['num']
+    if positional and given['uncertainty'] is None:
+        given['uncertainty'] = numbers['uncertainty']
+    return given
+def _numbers_parse(given, args):
+    '''Private function for use only in round() & Rounder:
+    Adds the parsed number (& positional uncertainty) to a copy of the resolved options from _options_parse()
+    '''
+    given = dict(given)
+    if given['engine'] == 'decimal':
+        given['num'] = _decimal_value(args[0])
+    else:
+        given['num'] = _num_parse(args[0])
+    if 'uncertainty' in given and given['uncertainty'] is None:
+        given['uncertainty'] = _num_parse(args[1])
+    return given
+def _warnings_parse(kwargs):
+    '''Private function for use only in _arguments_parse() & _options_parse() functions:
+    Applies the warnings argument, returning the options dict it begins
     '''
     given = {'reset_warnings': False}
-
     if any([w in kwargs for w in ('warn', 'warning', 'warnings')]):
         warning = kwargs.get('warn') or kwargs.get('warning') or kwargs.get('warnings')
-        if not warning:
-            filterwarnings('ignore')
-        elif warning == True:
-            resetwarnings()
+        if type(warning) is str and warning in _warning_policies:
+            pass
         else:
-            resetwarnings()
-            warn(f'warnings argument expected to be True, False, or "once". Got "{warning}"', stacklevel=_warn_stacklevel(3))
-        given['reset_warnings'] = True
-
-    types = (numbers.Number, str, Decimal, _Number, type(None))
-    given['output_type'] = type(args[0])
-    if not isinstance(args[0], types):
-        raise TypeError(f'Invalid input type of {type(args[0])}, expecting 1 of {types}')
-    given['num'] = _num_parse(args[0])
-    if len(args) >= 2:
-        if type(args[1]) == int:
-            given['sigfigs'] = args[1]
+            if not warning:
+                filterwarnings('ignore')
+            elif warning == True:
+                resetwarnings()
+            else:
+                resetwarnings()
+                warn(f'warnings argument expected to be True, False, or 1 of {_warning_policies}. Got "{warning}"', stacklevel=3)
+            given['reset_warnings'] = True
+            given['warnings'] = bool(warning)
+    return given
+def _options_parse(input_type, args, kwargs, given=None):
+    '''Private function for use only in _arguments_parse() function & Rounder class:
+    Resolves all rounding & formatting options which don't depend on the value of the number being rounded
+    (continuing the options given by _warnings_parse() when already applied).
+    A positional uncertainty is marked with given['uncertainty'] = None to be parsed by _numbers_parse()
+    '''
+    if given is None:
+        given = _warnings_parse(kwargs)
+    defaults = _settings.get()
+
+    given['output_type'] = input_type
+    if len(args) >= 1:
+        if type(args[0]) == int:
+            given['sigfigs'] = args[0]
             if given['sigfigs'] < 1:
-                warn('cannot have less that 1 significant figure, setting to 1', stacklevel=_warn_stacklevel(3))
+                warn('cannot have less that 1 significant figure, setting to 1', stacklevel=3)
                 given['sigfigs'] = 1
-        elif args[1] != args[1]:
-            warn(f'Ignoring 2nd argument "{args[1]}". invalid uncertainty, expecting number', stacklevel=_warn_stacklevel(3))
+        elif args[0] != args[0]:
+            warn(f'Ignoring 2nd argument "{args[0]}". invalid uncertainty, expecting number', stacklevel=3)
         else:
-            given['uncertainty'] = _num_parse(args[1])
+            given['uncertainty'] = None
             given['output_type'] = str
-    if len(args) > 2:
-        warn(f"last {int(len(args) - 3)} argument(s) discarded/ignored", stacklevel=_warn_stacklevel(3))
+    if len(args) > 1:
+        warn(f"last {int(len(args) - 2)} argument(s) discarded/ignored", stacklevel=3)
     
-    for key in _manual_settings:
-        given[key] = _manual_settings[key]
-
-    keys = {'separator', 'separation', 'sep', 'format', 'sigfigs', 's', 'decimals', 'd', 'uncertainty', 'u', 'cutoff', 'spacing', 'spacer', 'decimal', 'output_type', 'output', 'type', 'style', 'prefix', 'exponent', 'notation', 'form', 'crop'}
+    keys = {'separator', 'separation', 'sep', 'format', 'sigfigs', 's', 'decimals', 'd', 'uncertainty', 'u', 'cutoff', 'spacing', 'spacer', 'decimal', 'output_type', 'output', 'type', 'style', 'prefix', 'exponent', 'notation', 'form', 'crop', 'engine'}
     for key in kwargs:
         val = kwargs[key]
+        if key in {'warn', 'warning', 'warnings'}:
+            continue
         if key not in keys:
-            warn(f'unrecognized argument, skipping {key}={val}', stacklevel=_warn_stacklevel(3))
+            warn(f'unrecognized argument, skipping {key}={val}', stacklevel=3)
             continue
-        if key in given and key not in _manual_settings:
+        if key in given:
             None
             #warn("overwriting %s=%s with %s=%s" % (key, given[key], key, val))
         if key in {'sigfigs', 's', 'decimals', 'd', 'cutoff', 'crop'}:
@@ -334,31 +669,35 @@ def _arguments_parse(args, kwargs):
                 if key == 'crop':
                     key = 'cutoff'
                 if not isinstance(val, numbers.Integral):
-                    warn(f'use integer type for {key} argument', stacklevel=_warn_stacklevel(3))
+                    warn(f'use integer type for {key} argument', stacklevel=3)
                 if key in {'cutoff', 'crop'} and int(val) < 9:
-                    warn('cutoff/crop cannot be < 9, setting to 9', stacklevel=_warn_stacklevel(3))
+                    warn('cutoff/crop cannot be < 9, setting to 9', stacklevel=3)
                     val = 9
                 if key == 'sigfigs' and int(val) < 1:
-                    warn('cannot have less that 1 significant figure, setting to 1', stacklevel=_warn_stacklevel(3))
+                    warn('cannot have less that 1 significant figure, setting to 1', stacklevel=3)
                     val = 1
                 given[key] = int(val)
             except:
-                warn(f'Ignoring {key}={val}, invalid type of {type(val)}, expecting integer type', stacklevel=_warn_stacklevel(3))
+                warn(f'Ignoring {key}={val}, invalid type of {type(val)}, expecting integer type', stacklevel=3)
+        elif key == 'engine':
+            if type(val) is str and val in _engines:
+                given['engine'] = val
+            else:
+                warn(f"Ignoring {key}={val}, expecting 1 of: {_engines}", stacklevel=3)
         elif key in {'uncertainty', 'u'}:
             try:
                 assert(val == val)
                 given['uncertainty'] = _num_parse(val)
                 given['output_type'] = str
             except:
-                warn(f"Ignoring {key}={val}. invalid uncertainty, expecting number", stacklevel=_warn_stacklevel(3))
+                warn(f"Ignoring {key}={val}. invalid uncertainty, expecting number", stacklevel=3)
         elif key == 'prefix':
             if type(val) == bool or val in {'major', 'sci', 'eng'}:
                 given[key] = val
             elif val in ['minor', 'all']:
                 given['prefix'] = 'all'
             else:
-                prefixes = { True, False, 'major', 'minor', 'sci', 'eng', 'all'}
-                warn(f"Ignoring {key}={val}, invalid prefix setting, expecting 1 of: {prefixes}", stacklevel=_warn_stacklevel(3))
+                warn(f"Ignoring {key}={val}, invalid prefix setting, expecting 1 of: {_prefixes}", stacklevel=3)
                 continue
             given['output_type'] = str
         elif key in {'spacer', 'decimal'}:
@@ -376,45 +715,36 @@ def _arguments_parse(args, kwargs):
                 given['separator'] = 'brackets'
             elif val in {tuple, list}:
                 given['output'] = val
-                given['output_type'] = type(args[0])
+                given['output_type'] = input_type
             elif val == 'tuple':
                 given['output'] = tuple
-                given['output_type'] = type(args[0])
+                given['output_type'] = input_type
             elif val == 'list':
                 given['output'] = list
-                given['output_type'] = type(args[0])
+                given['output_type'] = input_type
             given['separator'] = str(val)
         elif key in ['format', 'style', 'output', 'type', 'output_type', 'notation', 'form']:
             given['output_type'] = str
             #warning might be warranted if output_type previously specified
             properties = ['spacing', 'spacer', 'decimal', 'separator', 'cutoff', 'prefix', 'form']
-            formats = {'English': [3, ',', '.', ' ± ', 9, False,  '#,###,###.## ± 0.#'],
-                       'French':  [3, ' ', ',', ' ± ', 99, False, '# ### ###,## ± 0,##'],
-                       'other':   [3, '.', ',', ' ± ', 99, False, '#.###.###,## ± 0,##'],
-                       'PDG':     [.1, '', '.', ' ± ', 35, False,  '# ### ###.##(##)'],
-                       'Drake':   [3, ' ', '.', 'brackets', 29, False, '# ### ###.##(##)'],
-                       'sci':     [.1, '', '.', ' ± ', 9, 'sci', '# ### ###.##(##)'],
-                       'eng':     [.1, '', '.', ' ± ', 9, 'eng', '# ### ###.##(##)'],
-                       'std':     [.1, '', '.', ' ± ', 9, False, '# ### ###.##(##)']}
             outputs = {'+-', 'map'}
-            notations = {'sci', 'scientific', 'eng', 'engineering', 'std', 'standard'}
-            if val in notations:
+            if val in _notations:
                 val = val[:3]
                 if val == 'sta':
                     val = 'std'
                 for i, prop in enumerate(properties):
-                    #if prop in given and key not in _manual_settings:
+                    #if prop in given:
                     if prop in given:
                         continue
-                        #warn("overwriting %s=%s with %s=%s" % (prop, given[prop], prop, formats[val][i]))
-                    given[prop] = formats[val][i]
-            elif val in formats:
+                        #warn("overwriting %s=%s with %s=%s" % (prop, given[prop], prop, _formats[val][i]))
+                    given[prop] = _formats[val][i]
+            elif val in _formats:
                 for i, prop in enumerate(properties):
-                    if prop in given and key not in _manual_settings:
+                    if prop in given:
                         None
-                        #warn("overwriting %s=%s with %s=%s" % (prop, given[prop], prop, formats[val][i]))
-                    given[prop] = formats[val][i]
-            elif isinstance(val, type) and issubclass(val, types):
+                        #warn("overwriting %s=%s with %s=%s" % (prop, given[prop], prop, _formats[val][i]))
+                    given[prop] = _formats[val][i]
+            elif isinstance(val, type) and issubclass(val, _types):
                 given['output_type'] = val
                 if 'prefix' in given:
                     del given['prefix']
@@ -424,191 +754,199 @@ def _arguments_parse(args, kwargs):
                 else:
                     given['output'] = val
             else:
-                warn(f"expected format of {[f for f in formats] + [o for o in outputs]}, ignoring format of {val}", stacklevel=_warn_stacklevel(3))
-                given['output_type'] = type(args[0])
+                warn(f"expected format of {[f for f in _formats] + [o for o in outputs]}, ignoring format of {val}", stacklevel=3)
+                given['output_type'] = input_type
         else:
             given[key] = val
 
     if 'sigfigs' in given and 'decimals' in given:
-        warn('Cannot round by both sigfigs & decimals, ignoring decimal constraint', stacklevel=_warn_stacklevel(3))
+        warn('Cannot round by both sigfigs & decimals, ignoring decimal constraint', stacklevel=3)
         del given['decimals']
     if 'uncertainty' in given and any([x in given for x in ['sigfigs', 'decimals', 'arg2']]):
         warn(
             'Cannot round by both uncertainty & decimals/sigfigs simultaneously, ignoring decimals &/or sigfigs.  Use seperate calls to round() function for seperate roundings.',
-            stacklevel=_warn_stacklevel(3)
+            stacklevel=3
         )
         for prop in ['sigfigs', 'decimals', 'arg2']:
             if prop in given:
                 del given[prop]
     if 'arg2' in given:
         if 'sigfigs' in given or 'decimals' in given:
-            warn('Invalid 2nd argument, ignoring. "sigfigs" or "decimals" given in keyword arguments', stacklevel=_warn_stacklevel(3))
-        elif _default_settings['round_by_sigfigs']:
+            warn('Invalid 2nd argument, ignoring. "sigfigs" or "decimals" given in keyword arguments', stacklevel=3)
+        elif defaults.round_by_sigfigs:
             given['sigfigs'] = given['arg2']
         else:
             given['decimals'] = given['arg2']
         del given['arg2']
-    if not issubclass(given['output_type'], (numbers.Real, Decimal, _Number)):
+    numeric = issubclass(given['output_type'], (numbers.Real, Decimal, _Number))
+    if not numeric:
         given['format'] = {}
         if 'spacer' in given and 'spacing' not in given:
             given['spacing'] = 3
         if 'spacing' in given and 'spacer' not in given:
             given['spacer'] = ","
-        for prop in {'decimal', 'spacer', 'spacing'}:
+        for prop in ('decimal', 'spacer', 'spacing'):
             if prop in given:
-                val = given[prop]
-                del given[prop]
-            elif prop in _manual_settings:
-                val = _manual_settings[prop]
+                given['format'][prop] = given.pop(prop)
             else:
-                val = _default_settings[prop]
-            given['format'][prop] = val
-    for prop in ['separator', 'prefix', 'exponent']:
-        if prop in given:
-            continue
-        elif prop in _manual_settings:
-            given[prop] = _manual_settings[prop]
-        else:
-            given[prop] = _default_settings[prop]
+                given['format'][prop] = getattr(defaults, prop)
+    if 'separator' not in given:
+        given['separator'] = defaults.separator
+        if defaults.external_brackets:
+            given['external_brackets'] = True
+    if 'prefix' not in given:
+        given['prefix'] = False if numeric else defaults.prefix
+    for prop in ('exponent', 'cutoff', 'engine'):
+        if prop not in given:
+            given[prop] = getattr(defaults, prop)
+    if 'format' in given:
+        given['formatter'] = _formatter(given['format'], given['separator'], given['prefix'], 'external_brackets' in given)
 
     return given
+_digits = '0123456789'
+_exponents = 'EeDdQq'
+_number_pattern = re.compile(r'([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[EeDdQq]([+-]?)([0-9]*))?')
 def _num_parse(num):
     '''Private function for use only in round()'s _arguments_parse() function:
     Translates given number of any type into returned _Number data structure
 
+    int, float, Decimal & NumPy scalars are translated directly into (sign, digits, exponent),
+    anything else (or any of these which isn't finite) is parsed from its string representation.
+
     Parsing Algorythm [O(N)]:
     - convert to string
-    - characters are analyzed sequentially in a KMP-like state graph. ie:
-       number: -325.7854E-5 
+    - match the whole string in a single pass against the number grammar:
+       [sign] [digits] [. digits] [E/e/D/d/Q/q [sign] digits]
+    - ValueError is raised if input number cannot be deciphered, in which case
+      characters are analyzed sequentially in a KMP-like state graph to locate the culprit. ie:
+       number: -325.7854E-5
        state:  ABBBBCCCCDEE
-    - ValueError is raised if input number cannot be deciphered
+
+    All state is kept in local variables so this function is reentrant & thread-safe.
     '''
-    global number, i, n, negative_exp, exp
+    if type(num) is _Number:
+        return num.copy()
     number = _Number()
-    i = 0
-    n = 0
-    negative_exp = False
-    exp = 0
 
-    if type(num) == type(number):
-        return deepcopy(num)
     if num is None:
-        warn('no number provided, assuming zero (0)', stacklevel=_warn_stacklevel(4))
-        number.map[0] = 0
+        warn('no number provided, assuming zero (0)', stacklevel=4, status=Status.MISSING)
+        number.digits.append(48)
         number.zero = True
         return number
     if num != num:
-        warn('given input is not a number (NaN)')
+        warn('given input is not a number (NaN)', status=Status.NAN)
         number.nan = True
-        number.map['NaN'] = num
+        number.nan_value = num
         return number
-    num = str(num)
-
-    digits = set([str(a) for a in range(10)])
-    exponents = set(['E', 'e', 'D', 'd', 'Q', 'q'])
 
-    def A(num):
-        global number, i, n
-        i += 1
-        if not num or num in '.-+':
-            warn('no number provided, assuming zero (0)', stacklevel=_warn_stacklevel(4))
-            number.map[0] = 0
+    parser = _parsers.get(type(num))
+    if parser is None and type(num).__module__ == 'numpy':
+        if isinstance(num, numbers.Integral):
+            parser = _int_parse
+        elif isinstance(num, numbers.Real):
+            parser = _float_parse
+    parsed = parser(num) if parser else None
+    if parsed is not None:
+        number.negative, digits, number.exponent = parsed
+        number.digits = bytearray(digits.lstrip(b'0'))
+        if not number.digits:
+            number.digits.append(48)
+            number.exponent = 0
             number.zero = True
-            return None
-        elif num[0] in exponents:
-            warn('no number provided, assuming zero (0)', stacklevel=_warn_stacklevel(4))
-            number.map[0] = 0
-            number.zero = True
-            D(num[1:])
-        elif num[0] in '+-':
-            number.set_sign(num[0])
-            B(num[1:])
-        elif num[0] in '.':
-            C(num[1:])
-        elif num[0] in digits:
-            n += 1
-            number.map[-n] = int(num[0])
-            B(num[1:])
-        else:
-            raise ValueError(f'parsing failed: invalid input Character "{num[0]}" (position {i}, state A)')
-    def B(num):
-        global number, i, n
-        i += 1
-        if not num:
-            number.increment_power_by(n)
-            return None
-        elif num[0] in exponents:
-            number.increment_power_by(n)
-            D(num[1:])
-        elif num[0] in '.':
-            number.increment_power_by(n)
-            n = 0
-            C(num[1:])
-        elif num[0] in digits:
-            n += 1
-            number.map[-n] = int(num[0])
-            B(num[1:])
-        else:
-            raise ValueError(f'parsing failed: invalid Character "{num[0]}" (position {i}, state B)')
-    def C(num):
-        global number, i, n
-        i += 1
-        if not num:
-            return None
-        elif num[0] in exponents:
-            D(num[1:])
-        elif num[0] in digits:
-            n += 1
-            number.map[-n] = int(num[0])
-            C(num[1:])
-        else:
-            raise ValueError(f'parsing failed: invalid Character "{num[0]}" (position {i}, state C)')
-    def D(num):
-        global i, negative_exp, exp
-        
-        i += 1
-        if not num:
-            warn('exponent expected but not provided', stacklevel=_warn_stacklevel(4))
-            return None
-        elif num[0] in '+-':
-            if num[0] == '-':
-                negative_exp = True
-            if not num[1:]:
-                warn('exponent expected but not provided', stacklevel=_warn_stacklevel(4))
-            exp = 0
-            E(num[1:])
-        elif num[0] in digits:
-            exp = int(num[0])
-            E(num[1:])
-        else:
-            raise ValueError(f'invalid Character "{num[0]}" (position {i}, state D)')
-    def E(num):
-        global number, i, exp
-        i += 1
-        if not num:
-            sign = 1
-            if negative_exp:
-                sign = -1
-            number.increment_power_by(sign*exp)
-            return None
-        elif num[0] in digits:
-            exp = 10*exp + int(num[0])
-            E(num[1:])
-        else:
-            raise ValueError(f'invalid Character "{num[0]}" (position {i}, state E)')
+        return number
+    num = str(num)
 
-    A(num)
+    if num in '.-+':
+        warn('no number provided, assuming zero (0)', stacklevel=4, status=Status.MISSING)
+        number.digits.append(48)
+        number.zero = True
+        return number
+    if num[0] in _exponents:
+        warn('no number provided, assuming zero (0)', stacklevel=4, status=Status.MISSING)
+    match = _number_pattern.fullmatch(num)
+    if match is None:
+        _num_parse_error(num)
+    sign, whole, fraction, exp_sign, exp = match.groups()
+    if fraction is None:
+        fraction = ''
+    if exp_sign is not None and not exp:
+        warn('exponent expected but not provided', stacklevel=4)
+    if sign:
+        number.set_sign(sign)
 
-    p = number.max_power()
-    while p in number.map and number.map[p] == 0:
-        del number.map[p]
-        p -= 1
+    number.digits = bytearray((whole + fraction).lstrip('0'), 'ascii')
+    number.exponent = -len(fraction)
+    if exp:
+        number.exponent += -int(exp) if exp_sign == '-' else int(exp)
 
-    if not number.map:
-        number.map[0] = 0
+    if not number.digits:
+        number.digits.append(48)
+        number.exponent = 0
         number.zero = True
 
     return number
+def _int_parse(num):
+    '''Private function for use only in _num_parse() function:
+    returns (negative, ASCII digits, exponent) of an integer
+    '''
+    return num < 0, str(abs(int(num))).encode(), 0
+def _float_parse(num):
+    '''Private function for use only in _num_parse() function:
+    returns (negative, ASCII digits, exponent) from the shortest repr of a float, None if not finite
+    '''
+    mantissa, _, exp = str(num).partition('e')
+    negative = mantissa[:1] == '-'
+    whole, _, fraction = mantissa.lstrip('-').partition('.')
+    digits = (whole + fraction).encode()
+    if not digits.isdigit():
+        return None
+    return negative, digits, (int(exp) if exp else 0) - len(fraction)
+def _decimal_parse(num):
+    '''Private function for use only in _num_parse() function:
+    returns (negative, ASCII digits, exponent) of a Decimal, None if not finite
+    '''
+    sign, digits, exp = num.as_tuple()
+    if type(exp) != int:
+        return None
+    return sign == 1, bytes(digits).translate(_ascii_digits), exp
+_parsers = {int: _int_parse, float: _float_parse, Decimal: _decimal_parse}
+_ascii_digits = bytes.maketrans(bytes(range(10)), b'0123456789')
+_exact_powers = [10**p for p in range(23)]
+
+def _num_parse_error(num):
+    '''Private function for use only in _num_parse() function:
+    Walks the state graph of an unparsable number string to raise ValueError describing the first invalid character
+    '''
+    state = 'A'
+    for i, c in enumerate(num, 1):
+        if state == 'A':
+            if c in _exponents:
+                state = 'D'
+            elif c in '+-' or c in _digits:
+                state = 'B'
+            elif c == '.':
+                state = 'C'
+            else:
+                raise ValueError(f'parsing failed: invalid input Character "{c}" (position {i}, state A)')
+        elif state == 'B':
+            if c in _exponents:
+                state = 'D'
+            elif c == '.':
+                state = 'C'
+            elif c not in _digits:
+                raise ValueError(f'parsing failed: invalid Character "{c}" (position {i}, state B)')
+        elif state == 'C':
+            if c in _exponents:
+                state = 'D'
+            elif c not in _digits:
+                raise ValueError(f'parsing failed: invalid Character "{c}" (position {i}, state C)')
+        elif state == 'D':
+            if c in '+-' or c in _digits:
+                state = 'E'
+            else:
+                raise ValueError(f'invalid Character "{c}" (position {i}, state D)')
+        elif c not in _digits:
+            raise ValueError(f'invalid Character "{c}" (position {i}, state E)')
 
 def round(*args, **kwargs):
     '''
@@ -627,41 +965,187 @@ def round(*args, **kwargs):
     For detailed usage instructions see https://pypi.org/project/sigfig/
     '''
     if not args:
-        warn("no input number given, nothing to return", stacklevel=_warn_stacklevel(2))
+        warn("no input number given, nothing to return", stacklevel=2)
         return None
-    given = _arguments_parse(args, kwargs)
+    if kwargs:
+        policy = _call_policy(kwargs)
+        if policy:
+            return _policy_call(policy, _round_call, args, kwargs)
+    return _round_call(args, kwargs)
+
+def _round_call(args, kwargs):
+    '''Private function for use only in round() function:
+    rounds through the result cache when enabled
+    '''
+    if _cache.maxsize:
+        return _cache.round(args, kwargs)
+    return _round(_arguments_parse(args, kwargs))
+
+def _round(given):
+    '''Private function for use only in round() function & Rounder class:
+    Performs the rounding & formatting described by the dict returned from _arguments_parse()
+    '''
     num = given['num']
 
+    if type(num) is Decimal:
+        return _round_decimal(given)
     if num.nan:
-        return num.map['NaN']
+        return num.nan_value
     if 'decimals' in given:
         num.round_by_decimals(given['decimals'])
     elif 'sigfigs' in given:
-        if given['sigfigs'] > len(num.map):
-            warn(
-                f"{given['sigfigs']} significant figures requested from number with only {len(num.map)} significant figures",
-                stacklevel=_warn_stacklevel(2)
-            )
-        last_power = num.max_power() - given['sigfigs'] + 1
-        num.round_by_decimals(-last_power)
-        while len(num.map) > given['sigfigs']:
-            del num.map[num.min_power()]
+        _round_sigfigs(num, given['sigfigs'])
     elif 'uncertainty' in given:
         num.has_uncertainty = True
-        if 'cutoff' in given:
-            cutoff = str(given['cutoff'])
-        elif 'cutoff' in _manual_settings:
-            cutoff = str(_manual_settings['cutoff'])
-        else:
-            cutoff = str(_default_settings['cutoff'])
-        unc = round(given['uncertainty'], sigfigs=len(cutoff), output='map')
-        cut = _num_parse(cutoff + 'E' + str(unc.min_power()))
-        if unc > cut:
-            unc = round(given['uncertainty'], sigfigs=len(cutoff)-1, output='map')
-            if unc.map[unc.max_power()] == 1:
-                unc.map[unc.max_power() - 1] = 0
+        digits, limit = _cutoff(given)
+        unc = _round_sigfigs(given['uncertainty'].copy(), digits)
+        if int(unc.digits) > limit:
+            unc = _round_sigfigs(given['uncertainty'].copy(), digits - 1)
+            if unc.digits[0] == 49:
+                if len(unc.digits) > 1:
+                    unc.digits[1] = 48
+                else:
+                    unc.digits.append(48)
+                    unc.increment_power_by(-1)
         num.round_by_decimals(-unc.min_power())
+        return _output(given, num, unc)
+    return _output(given, num)
+
+def _round_sigfigs(num, sigfigs):
+    '''Private function for use only in _round() function:
+    returns _Number rounded in place to the given number of significant figures
+    '''
+    if sigfigs > len(num.digits):
+        warn(
+            f"{sigfigs} significant figures requested from number with only {len(num.digits)} significant figures",
+            stacklevel=2, status=Status.PRECISION
+        )
+    last_power = num.max_power() - sigfigs + 1
+    num.round_by_decimals(-last_power)
+    extra = len(num.digits) - sigfigs
+    if extra > 0:
+        del num.digits[-extra:]
+        num.increment_power_by(extra)
+    return num
+
+_engines = ('number', 'decimal')
+_decimal_context = Context(prec=MAX_PREC, rounding=ROUND_HALF_UP, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[])
+def _decimal_value(num):
+    '''Private function for use only in _numbers_parse() function:
+    returns a finite non-zero Decimal or numeric string as a Decimal for the decimal engine,
+    anything else is parsed into a _Number for the _Number engine
+    '''
+    if type(num) is str:
+        if not _number_pattern.fullmatch(num):
+            return _num_parse(num)
+        try:
+            value = Decimal(num)
+        except InvalidOperation:
+            return _num_parse(num)
+    elif type(num) is Decimal:
+        value = num
+    else:
+        return _num_parse(num)
+    if value and value.is_finite():
+        return value
+    return _num_parse(num)
+
+def _decimal_round(value, exponent):
+    '''Private function for use only in the decimal engine:
+    returns Decimal rounded (half away from zero) to the given 10's power
+    '''
+    quantum = _decimal_quanta.get(exponent)
+    if quantum is None:
+        quantum = Decimal((0, (1,), exponent))
+        if -64 <= exponent <= 64:
+            _decimal_quanta[exponent] = quantum
+    return value.quantize(quantum, context=_decimal_context)
+_decimal_quanta = {}
+
+def _decimal_sigfigs(value, sigfigs):
+    '''Private function for use only in the decimal engine:
+    returns non-zero Decimal rounded to the given number of significant figures
+    '''
+    digits = len(value.as_tuple().digits)
+    if sigfigs > digits:
+        warn(
+            f"{sigfigs} significant figures requested from number with only {digits} significant figures",
+            stacklevel=2, status=Status.PRECISION
+        )
+    top = value.adjusted()
+    rounded = _decimal_round(value, top - sigfigs + 1)
+    if rounded.adjusted() > top:
+        rounded = _decimal_round(rounded, top - sigfigs + 2)
+    return rounded
+
+def _decimal_number(value):
+    '''Private function for use only in the decimal engine:
+    returns rounded Decimal as a _Number, numbers rounded to zero becoming positive zero
+    known to the rounded 10's power (as with _Number.round_by_decimals())
+    '''
+    sign, digits, exponent = value.as_tuple()
+    number = _Number()
+    number.exponent = exponent
+    if value:
+        number.negative = sign == 1
+        number.digits = bytearray(bytes(digits).translate(_ascii_digits))
+    else:
+        number.digits.append(48)
+        number.zero = True
+    return number
+
+def _round_decimal(given):
+    '''Private function for use only in _round() function:
+    decimal engine, performs the rounding described by the dict returned from _arguments_parse()
+    with Decimal.quantize on a finite non-zero Decimal given['num'] instead of _Number.round_by_decimals(),
+    giving results identical to the _Number engine
+    '''
+    value = given['num']
+    if 'decimals' in given:
+        value = _decimal_round(value, -given['decimals'])
+    elif 'sigfigs' in given:
+        value = _decimal_sigfigs(value, given['sigfigs'])
+    elif 'uncertainty' in given:
+        unc = given['uncertainty']
+        if unc.nan or unc.zero:
+            given['num'] = _num_parse(value)
+            return _round(given)
+        count, limit = _cutoff(given)
+        unc = unc.output(Decimal)
+        uncertainty = _decimal_sigfigs(unc, count)
+        exponent = uncertainty.as_tuple().exponent
+        if abs(uncertainty.scaleb(-exponent, _decimal_context)) > limit:
+            uncertainty = _decimal_sigfigs(unc, count - 1)
+            sign, digits, exponent = uncertainty.as_tuple()
+            if digits[0] == 1:
+                if len(digits) > 1:
+                    digits = (1, 0) + digits[2:]
+                else:
+                    digits = (1, 0)
+                    exponent -= 1
+                uncertainty = Decimal((sign, digits, exponent))
+        num = _decimal_number(_decimal_round(value, exponent))
+        num.has_uncertainty = True
+        return _output(given, num, _decimal_number(uncertainty))
+    return _output(given, _decimal_number(value))
 
+def _cutoff(given):
+    '''Private function for use only in _round(), _round_decimal() & round_with_uncertainty_array() functions:
+    returns (number of digits, integer value) of the uncertainty cutoff from the resolved options,
+    the uncertainty being rounded to that many digits & then to 1 fewer if its digits exceed the value
+    '''
+    cutoff = given['cutoff']
+    parsed = _cutoffs.get(cutoff)
+    if parsed is None:
+        text = str(cutoff)
+        parsed = _cutoffs[cutoff] = (len(text), int(text))
+    return parsed
+_cutoffs = {}
+
+def _output(given, num, unc=None):
+    '''Private function for use only in _round() & round_with_uncertainty_array() functions:
+    Applies prefixes & returns the rounded number (& uncertainty) in the output type/format described by the resolved options
+    '''
     if given['prefix']:
         power_shift = num.prefixify(given['prefix'], given['exponent'])
         if 'uncertainty' in given:
@@ -677,36 +1161,1182 @@ def round(*args, **kwargs):
             return given['output']([num.output(given['output_type']),
                                     unc.output(given['output_type'])])
         return num.output(given['output_type'])
-    elif 'output' in given and given['output'] == 'map':
+    elif given['output_type'] is _Number or 'output' in given and given['output'] == 'map':
         return num
     
-    if 'uncertainty' in given and given['separator'] == 'brackets' and unc.min_power() > 0 and 'external_brackets' not in given:
-        return num.decimate(given['format'], unc=unc)
+    return given['formatter'](num, unc, given.get('output'))
 
-    output = num.decimate(given['format'])
-    units = num.prefix if given['prefix'] else ''
+class Rounder:
+    '''
+    Precompiled round() function: keyword arguments are validated & resolved once
+    (per input type) instead of on every call, for use in hot loops.
 
-    if 'output' in given and given['output'] in {list, tuple}:
-        if 'uncertainty' in given:
-            return given['output']([output + units, unc.decimate(given['format'], sign=False, units=units)])
-        return given['output']([output + units])
-
-    if 'uncertainty' in given:
-        if given['separator'] == 'brackets' and unc.min_power() > 0:
-            output += '('+unc.decimate(given['format'], sign=False)+')'
-        elif given['separator'] == 'brackets':
-            output += '('+unc.decimate(given['format'], zeropadding=False, sign=False)+')'
+    Calling a Rounder gives output identical to calling round() with the same arguments:
+        Rounder(**kwargs)(*args) == round(*args, **kwargs)
+
+    Options are resolved once per input type & settings() in effect, so calls within a settings() block
+    use its defaults just as round() does, while warnings about the keyword arguments are only issued when resolved.
+
+    Key usage examples:
+        Rounder(sigfigs=2)('2.675') => '2.7'
+        Rounder(format='Drake')('123456.789099', '-1.15E-4') => '123 456.789 10(12)'
+    '''
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self._options = {}
+        self._policy = _call_policy(kwargs)
+    @staticmethod
+    def _key(args):
+        '''returns the argument properties which the resolved options depend upon'''
+        if len(args) < 2:
+            return type(args[0]), len(args), None
+        second = args[1]
+        if type(second) == int:
+            return type(args[0]), len(args), second
+        return type(args[0]), len(args), second != second
+    def __call__(self, *args):
+        if not args:
+            warn("no input number given, nothing to return", stacklevel=2)
+            return None
+        key = self._key(args) + (_settings.get(),)
+        if key in self._options:
+            given = self._options[key]
+            if 'warnings' in given:
+                if given['warnings']:
+                    resetwarnings()
+                else:
+                    filterwarnings('ignore')
+        else:
+            if not isinstance(args[0], _types):
+                raise TypeError(f'Invalid input type of {type(args[0])}, expecting 1 of {_types}')
+            if self._policy:
+                given = self._options[key] = _policy_call(self._policy, _options_parse, type(args[0]), args[1:], self.kwargs)
+            else:
+                given = self._options[key] = _options_parse(type(args[0]), args[1:], self.kwargs)
+        if self._policy:
+            return _policy_call(self._policy, lambda: _round(_numbers_parse(given, args)))
+        return _round(_numbers_parse(given, args))
+
+def round_many(iterable, errors='mask', **kwargs):
+    '''
+    round every number of an iterable with the keyword arguments of round(),
+    returning (list of results, array of Status codes) with one entry per number.
+
+    Instead of issuing warnings or raising exceptions for individual numbers, their Status is recorded
+    (eg. Status.INVALID for unparseable strings or numbers too large for the output type, Status.NAN, Status.MISSING for None/empty strings).
+    Warnings about the keyword arguments themselves are issued as usual (once per input type).
+    errors determines the result given for numbers which can't be rounded (Status.INVALID & Status.UNSUPPORTED):
+        'mask': None
+        'coerce': float('nan')
+        'raise': the exception round() would raise is raised immediately
+
+    Key usage examples:
+        round_many(['2.675', 'x', None, '0.0314159'], sigfigs=2) => (['2.7', None, '0.0', '0.031'], array('B', [0, 1, 4, 0]))
+        round_many(['2.675', 'x'], errors='coerce', decimals=1) => (['2.7', nan], array('B', [0, 1]))
+    '''
+    if errors not in ('mask', 'raise', 'coerce'):
+        raise ValueError(f'errors expected to be 1 of {("mask", "raise", "coerce")}, got {errors!r}')
+    failed = None if errors == 'mask' else float('nan')
+    results, statuses = [], array('B')
+    options = {}
+    state, status = _warning_state.get(), _status.get()
+    quiet = 'suppress', state[1]
+    try:
+        for value in iterable:
+            kind = type(value)
+            given = options.get(kind)
+            if given is None:
+                if not isinstance(value, _types):
+                    if errors == 'raise':
+                        raise TypeError(f'Invalid input type of {kind}, expecting 1 of {_types}')
+                    results.append(failed)
+                    statuses.append(Status.UNSUPPORTED)
+                    continue
+                _warning_state.set(state)
+                _status.set(None)
+                given = options[kind] = _options_parse(kind, (), kwargs)
+            _warning_state.set(quiet)
+            _status.set(Status.OK)
+            try:
+                results.append(_round(_numbers_parse(given, (value,))))
+            except (ValueError, OverflowError):
+                if errors == 'raise':
+                    raise
+                results.append(failed)
+                _status.set(Status.INVALID)
+            statuses.append(_status.get())
+    finally:
+        _warning_state.set(state)
+        _status.set(status)
+    return results, statuses
+
+def round_iter(iterable, uncertainties=None, chunksize=1024, errors='raise', **kwargs):
+    '''
+    lazily round every number of a (possibly unbounded) iterable with the keyword arguments of round(),
+    optionally zipped with an iterable of uncertainties, yielding each result in turn with constant memory.
+    Keyword arguments are resolved once (per input type) as with Rounder.
+
+    Numbers are consumed chunksize at a time (use chunksize=1 for the lowest latency on slow sources).
+    When rounding by sigfigs or decimals alone, chunks of NumPy scalars of a single type, as well as NumPy arrays
+    given as elements, are rounded with round_array() (results are identical but per element warnings aren't issued).
+    errors determines the result given for numbers which can't be rounded, as with round_many():
+        'raise': the exception round() would raise is raised (ending the iteration)
+        'mask': None
+        'coerce': float('nan')
+
+    Key usage examples:
+        list(round_iter(['2.675', '0.0314159'], sigfigs=2)) => ['2.7', '0.031']
+        list(round_iter(['2.675', 'x', 10**400], errors='mask', sigfigs=2)) => ['2.7', None, None]
+        list(round_iter(['123.456', '7.8912'], ['0.0123', '0.456'])) => ['123.46 ± 0.01', '7.9 ± 0.5']
+        list(round_iter([numpy.array([2.675, 0.125])], decimals=2)) => [array([2.68, 0.13])]
+    '''
+    from itertools import islice
+    if errors not in ('mask', 'raise', 'coerce'):
+        raise ValueError(f'errors expected to be 1 of {("mask", "raise", "coerce")}, got {errors!r}')
+    failed = None if errors == 'mask' else float('nan')
+    rounder = Rounder(**kwargs)
+    if uncertainties is not None:
+        for value, uncertainty in zip(iterable, uncertainties):
+            try:
+                result = rounder(value, uncertainty)
+            except (ValueError, OverflowError, TypeError):
+                if errors == 'raise':
+                    raise
+                result = failed
+            yield result
+        return
+    vector = None
+    if len(kwargs) == 1:
+        (key, val), = kwargs.items()
+        if key in {'sigfigs', 's'} and type(val) == int and val >= 1:
+            vector = {'sigfigs': val}
+        elif key in {'decimals', 'd'} and type(val) == int:
+            vector = {'decimals': val}
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        kind = type(chunk[0])
+        if vector and kind.__module__ == 'numpy' and all([type(value) is kind for value in chunk]):
+            if kind.__name__ == 'ndarray':
+                for arr in chunk:
+                    yield round_array(arr, **vector)
+                continue
+            try:
+                rounded = round_array(chunk, **vector)
+            except (ValueError, OverflowError):
+                pass
+            else:
+                yield from rounded
+                continue
+        for value in chunk:
+            try:
+                result = rounder(value)
+            except (ValueError, OverflowError, TypeError):
+                if errors == 'raise':
+                    raise
+                result = failed
+            yield result
+
+_parallel_rounder = None
+def _parallel_init(kwargs, snapshot):
+    '''Private function for use only in round_parallel() function:
+    process pool initializer receiving the keyword arguments & settings once per worker
+    '''
+    global _parallel_rounder
+    _settings.set(snapshot)
+    _parallel_rounder = Rounder(**kwargs)
+
+def _parallel_chunk(values, uncertainties=None):
+    '''Private function for use only in round_parallel() function:
+    rounds 1 shard of the input within a worker process
+    '''
+    if uncertainties is None:
+        return [_parallel_rounder(value) for value in values]
+    return [_parallel_rounder(value, uncertainty) for value, uncertainty in zip(values, uncertainties)]
+
+def round_parallel(values, uncertainties=None, workers=None, chunksize=None, **kwargs):
+    '''
+    round every number (optionally with its uncertainty) with the keyword arguments of round()
+    across a pool of worker processes, returning a list of results in the order given.
+
+    The input is split into shards of chunksize numbers (by default ~4 shards per worker) and the keyword
+    arguments are sent once to each of the workers (default: os.cpu_count()) rather than with every shard.
+    Inputs of fewer than 10000 numbers (or workers=1) are rounded in process, where a pool costs more than it saves.
+
+    Key usage examples:
+        round_parallel(['2.675', '0.0314159'], sigfigs=2) => ['2.7', '0.031']
+        round_parallel(values, uncertainties, workers=8, format='PDG') => ['1.23(4)', ...]
+    '''
+    from concurrent.futures import ProcessPoolExecutor
+    from os import cpu_count
+    values = list(values)
+    if uncertainties is not None:
+        uncertainties = list(uncertainties)
+        if len(uncertainties) != len(values):
+            raise ValueError(f'{len(values)} values given with {len(uncertainties)} uncertainties')
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(values) < 10000:
+        rounder = Rounder(**kwargs)
+        if uncertainties is None:
+            return [rounder(value) for value in values]
+        return [rounder(value, uncertainty) for value, uncertainty in zip(values, uncertainties)]
+    chunksize = chunksize or -(-len(values) // (4 * workers))
+    starts = range(0, len(values), chunksize)
+    shards = [values[i:i+chunksize] for i in starts]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_parallel_init, initargs=(kwargs, _settings.get())) as pool:
+        if uncertainties is None:
+            rounded = pool.map(_parallel_chunk, shards)
+        else:
+            rounded = pool.map(_parallel_chunk, shards, [uncertainties[i:i+chunksize] for i in starts])
+        for shard in rounded:
+            results.extend(shard)
+    return results
+
+def _executor_chunk(snapshot, values, uncertainties, errors, kwargs):
+    '''Private function for use only in round_many_async() & round_iter_async() functions:
+    rounds 1 chunk within an executor thread or process under the settings & warning policy of the calling task,
+    with round_many() when errors is given, otherwise round_iter()
+    '''
+    token, state = _settings.set(snapshot[0]), _warning_state.set(snapshot[1])
+    try:
+        if errors is None:
+            return list(round_iter(values, uncertainties, chunksize=len(values), **kwargs))
+        return round_many(values, errors, **kwargs)
+    finally:
+        _warning_state.reset(state)
+        _settings.reset(token)
+
+async def _chunks_async(iterable, chunksize):
+    '''Private function for use only in _executor_rounds() function:
+    yields lists of up to chunksize items from a synchronous or asynchronous iterable
+    '''
+    from itertools import islice
+    if hasattr(iterable, '__aiter__'):
+        chunk = []
+        async for value in iterable:
+            chunk.append(value)
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+async def _executor_rounds(iterable, uncertainties, errors, executor, chunksize, prefetch, kwargs):
+    '''Private function for use only in round_many_async() & round_iter_async() functions:
+    submits the input chunk by chunk to the executor (keeping up to prefetch chunks in flight),
+    yielding each chunk's results in order & cancelling unfinished chunks when closed or cancelled
+    '''
+    import asyncio
+    from collections import deque
+    if type(chunksize) != int or chunksize < 1:
+        raise ValueError(f'chunksize must be a positive integer, got {chunksize!r}')
+    loop = asyncio.get_running_loop()
+    snapshot = _settings.get(), _warning_state.get()
+    chunks = _chunks_async(iterable, chunksize)
+    paired = None if uncertainties is None else _chunks_async(uncertainties, chunksize)
+    pending = deque()
+    try:
+        async for chunk in chunks:
+            pairs = None
+            if paired is not None:
+                try:
+                    pairs = await paired.__anext__()
+                except StopAsyncIteration:
+                    break
+                chunk, pairs = chunk[:len(pairs)], pairs[:len(chunk)]
+            pending.append(loop.run_in_executor(executor, _executor_chunk, snapshot, chunk, pairs, errors, kwargs))
+            if len(pending) > prefetch:
+                yield await pending.popleft()
+            if pairs is not None and len(pairs) < chunksize:
+                break
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        await chunks.aclose()
+        if paired is not None:
+            await paired.aclose()
+
+async def round_many_async(iterable, errors='mask', executor=None, chunksize=1024, prefetch=2, **kwargs):
+    '''
+    coroutine rounding every number of a (synchronous or asynchronous) iterable as round_many() does,
+    returning (list of results, array of Status codes), without blocking the event loop.  Also available as sigfig.aio.round_many().
+
+    Numbers are rounded chunksize at a time in the given concurrent.futures executor (thread or process pool,
+    by default the event loop's default executor) with up to prefetch chunks in flight, so control returns to the
+    event loop between chunks.  The settings() & warning policy of the calling task apply within the executor & cancelling the
+    coroutine cancels every chunk not yet started.
+
+    Key usage examples:
+        await round_many_async(['2.675', 'x', None, '0.0314159'], sigfigs=2) => (['2.7', None, '0.0', '0.031'], array('B', [0, 1, 4, 0]))
+        await round_many_async(values, executor=ProcessPoolExecutor(), format='Drake', uncertainty='0.01')
+    '''
+    if errors not in ('mask', 'raise', 'coerce'):
+        raise ValueError(f'errors expected to be 1 of {("mask", "raise", "coerce")}, got {errors!r}')
+    results, statuses = [], array('B')
+    rounds = _executor_rounds(iterable, None, errors, executor, chunksize, prefetch, kwargs)
+    try:
+        async for chunk, status in rounds:
+            results.extend(chunk)
+            statuses.extend(status)
+    finally:
+        await rounds.aclose()
+    return results, statuses
+
+async def round_iter_async(iterable, uncertainties=None, executor=None, chunksize=1024, prefetch=2, **kwargs):
+    '''
+    asynchronous iterator rounding every number of a (synchronous or asynchronous) iterable, optionally zipped
+    with an iterable of uncertainties, as round_iter() does, yielding each result in order without blocking the event loop.
+    Also available as sigfig.aio.round_iter().
+
+    Numbers are rounded chunksize at a time in the given concurrent.futures executor (thread or process pool,
+    by default the event loop's default executor) with up to prefetch chunks in flight ahead of the results consumed.
+    The settings() & warning policy of the calling task apply within the executor & closing or cancelling the iteration cancels every chunk not yet started.
+
+    Key usage examples:
+        [x async for x in round_iter_async(['2.675', '0.0314159'], sigfigs=2)] => ['2.7', '0.031']
+        async for result in round_iter_async(queue_reader(), executor=pool, format='PDG'): ...
+    '''
+    rounds = _executor_rounds(iterable, uncertainties, None, executor, chunksize, prefetch, kwargs)
+    try:
+        async for chunk in rounds:
+            for result in chunk:
+                yield result
+    finally:
+        await rounds.aclose()
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+class _Cache:
+    '''Private class for use only in round() function:
+    Thread safe LRU cache of round() results keyed on the type & value of each positional argument plus the keyword arguments
+    '''
+    def __init__(self):
+        self.maxsize = 0
+        self.results = OrderedDict()
+        self.lock = _thread.allocate_lock()
+        self.hits = self.misses = 0
+    @staticmethod
+    def _key(args, kwargs):
+        '''returns key distinguishing every input which rounds differently (eg. -0.0 vs 0.0, 1.0 vs 1.00), None if uncacheable'''
+        key = []
+        for arg in (*args, *kwargs.values()):
+            kind = type(arg)
+            if kind is str or kind is int or (kind is float and arg):
+                key.append((kind, arg))
+            elif kind is _Number:
+                return None
+            else:
+                key.append((kind, str(arg)))
+        return tuple(key), tuple(kwargs), len(args), _settings.get()
+    @staticmethod
+    def _copy(result):
+        '''returns copy of mutable results so a cached result is never shared'''
+        if type(result) is _Number:
+            return result.copy()
+        if type(result) is list:
+            return list(result)
+        return result
+    def round(self, args, kwargs):
+        key = self._key(args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            return _round(_arguments_parse(args, kwargs))
+        with self.lock:
+            result = self.results.get(key, _Cache)
+            if result is not _Cache:
+                self.results.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if result is not _Cache:
+            if ('warn' in kwargs or 'warning' in kwargs or 'warnings' in kwargs) and not _call_policy(kwargs):
+                resetwarnings()
+            return self._copy(result)
+        issued = getattr(_local, 'warnings', 0)
+        result = _round(_arguments_parse(args, kwargs))
+        if getattr(_local, 'warnings', 0) == issued:
+            with self.lock:
+                self.results[key] = self._copy(result)
+                while len(self.results) > self.maxsize:
+                    self.results.popitem(last=False)
+        return result
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.hits = self.misses = 0
+_cache = _Cache()
+
+def set_cache(maxsize=1024):
+    '''
+    enable (or resize) memoization of round() results, keeping up to maxsize of the most recently used results.
+    set_cache(0) disables the cache (the default).
+
+    Results are keyed on the type & value of each positional argument along with the keyword arguments,
+    so output is identical with or without the cache.  Mutable results (output='map', output=list) are copied
+    rather than shared and calls which issue warnings are never cached.
+
+    Key usage examples:
+        set_cache(4096)
+        round(2.675, sigfigs=2) => 2.7 (cache miss)
+        round(2.675, sigfigs=2) => 2.7 (cache hit)
+        cache_info() => CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+    '''
+    if type(maxsize) != int or maxsize < 0:
+        raise ValueError(f'maxsize must be a non-negative integer, got {maxsize!r}')
+    with _cache.lock:
+        _cache.maxsize = maxsize
+        while len(_cache.results) > maxsize:
+            _cache.results.popitem(last=False)
+
+def cache_info():
+    '''returns CacheInfo(hits, misses, maxsize, currsize) of the round() result cache'''
+    with _cache.lock:
+        return CacheInfo(_cache.hits, _cache.misses, _cache.maxsize, len(_cache.results))
+
+def cache_clear():
+    '''empties the round() result cache & resets its statistics'''
+    _cache.clear()
+
+_stages = {
+    'arguments_parse': ('_arguments_parse', None),
+    'num_parse': ('_num_parse', None),
+    'round': ('_round', None),
+    'round_by_decimals': ('round_by_decimals', _Number),
+    'prefixify': ('prefixify', _Number),
+    'decimate': ('__call__', _Formatter),
+    'output': ('_output', None),
+}
+
+class _Stats:
+    '''
+    Private class for use only in instrument() & stats() functions:
+    call counts & cumulative nanoseconds per stage, counts per input type, rounding mode & warning status,
+    with the original functions replaced by their timed wrappers while instrumented
+    '''
+    def __init__(self):
+        self.lock = _thread.allocate_lock()
+        self.originals = {}
+        self.clear()
+    def clear(self):
+        self.stages = {stage: [0, 0] for stage in _stages}
+        self.inputs = Counter()
+        self.modes = Counter()
+        self.warnings = Counter()
+    def snapshot(self):
+        return {'enabled': bool(self.originals),
+                'stages': {stage: {'calls': calls, 'ns': ns} for stage, (calls, ns) in self.stages.items()},
+                'inputs': dict(self.inputs), 'modes': dict(self.modes), 'warnings': dict(self.warnings)}
+_stats = _Stats()
+
+def _timed(stage, func):
+    '''Private function for use only in instrument() function:
+    returns func wrapped to tally its calls & cumulative nanoseconds under the given stage,
+    top level _round() calls also tallying the input type & rounding mode (nested calls are timed by their caller)
+    '''
+    from time import perf_counter_ns
+    if stage == 'round':
+        def timed(given):
+            if getattr(_local, 'depth', 0):
+                return func(given)
+            mode = 'decimals' if 'decimals' in given else 'sigfigs' if 'sigfigs' in given else 'uncertainty' if 'uncertainty' in given else 'none'
+            _local.depth = 1
+            start = perf_counter_ns()
+            try:
+                return func(given)
+            finally:
+                elapsed = perf_counter_ns() - start
+                _local.depth = 0
+                with _stats.lock:
+                    record = _stats.stages[stage]
+                    record[0] += 1
+                    record[1] += elapsed
+                    _stats.inputs[getattr(_local, 'input', None)] += 1
+                    _stats.modes[mode] += 1
+        return timed
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            with _stats.lock:
+                record = _stats.stages[stage]
+                record[0] += 1
+                record[1] += elapsed
+    return timed
+
+def _hooks():
+    '''Private function for use only in instrument() function:
+    returns {(owner, attribute name): instrumented replacement} for every function instrument() replaces
+    '''
+    module = globals()
+    def recorded(given, args, numbers_parse=_numbers_parse):
+        '''records the input type of top level calls for the round stage'''
+        if not getattr(_local, 'depth', 0):
+            _local.input = type(args[0]).__name__
+        return numbers_parse(given, args)
+    def counted(message, category=UserWarning, stacklevel=1, status=Status.WARNING, warn=warn):
+        '''tallies warnings by status'''
+        with _stats.lock:
+            _stats.warnings[Status(status).name] += 1
+        return warn(message, category, stacklevel, status)
+    hooks = {(None, '_numbers_parse'): recorded, (None, 'warn'): counted}
+    for stage, (name, owner) in _stages.items():
+        hooks[owner, name] = _timed(stage, owner.__dict__[name] if owner else module[name])
+    return hooks
+
+def instrument(enabled=True):
+    '''
+    enable (or disable) recording of round() call counts & cumulative nanoseconds per stage
+    (arguments_parse, num_parse, round, round_by_decimals, prefixify, decimate, output),
+    counts per input type & rounding mode of top level calls, & counts of warnings issued by status (see stats()).
+
+    Stage timings are inclusive (eg. output includes prefixify & decimate, arguments_parse includes num_parse).
+    While disabled (the default), the uninstrumented functions are called directly so there is no overhead.
+    Recording is process wide & thread-safe; results served by the round() result cache aren't recorded.
+
+    Key usage examples:
+        instrument()
+        round('123.456', '0.0123', format='Drake') => '123.456(12)'
+        stats()['stages']['output'] => {'calls': 1, 'ns': 12875}
+        instrument(False)
+    '''
+    module = globals()
+    with _stats.lock:
+        if bool(enabled) == bool(_stats.originals):
+            return
+        replacements = _hooks() if enabled else _stats.originals
+        originals = {}
+        for (owner, name), function in replacements.items():
+            if owner:
+                originals[owner, name] = owner.__dict__[name]
+                setattr(owner, name, function)
+            else:
+                originals[owner, name] = module[name]
+                module[name] = function
+        _stats.originals = originals if enabled else {}
+
+def stats(clear=False):
+    '''
+    returns a snapshot (as a dict of plain dicts & ints for export to metrics systems) of what instrument() has recorded:
+        {'enabled': bool,
+         'stages': {stage: {'calls': int, 'ns': int}, ...},
+         'inputs': {input type name: calls, ...},
+         'modes': {'sigfigs' | 'decimals' | 'uncertainty' | 'none': calls, ...},
+         'warnings': {Status name: warnings issued, ...}}
+    optionally clearing the recorded values in the same step (eg. to export counts per interval)
+
+    Key usage examples:
+        stats()['modes'] => {'uncertainty': 1}
+        stats(clear=True)['inputs'] => {'str': 1}
+    '''
+    with _stats.lock:
+        snapshot = _stats.snapshot()
+        if clear:
+            _stats.clear()
+    return snapshot
+
+_array_tables = {}
+def _array_table(dtype):
+    '''Private function for use only in round_array() function:
+    Returns (correctly rounded powers of ten in given dtype indexed from 1E-400, decimal precision, smallest normal value)
+    '''
+    import numpy
+    if dtype not in _array_tables:
+        with numpy.errstate(all='ignore'):
+            powers = numpy.array([dtype.type(f'1E{p}') for p in range(-400, 401)], dtype=dtype)
+        info = numpy.finfo(dtype)
+        _array_tables[dtype] = (powers, info.precision, info.tiny)
+    return _array_tables[dtype]
+
+def _array_cast(values, dtype):
+    '''Private function for use only in round_array() function:
+    Casts correctly rounded float64 values to given dtype, additionally returning a mask of
+    values which sit exactly halfway between 2 values of dtype (double rounding is ambiguous)
+    '''
+    import numpy
+    if dtype == numpy.float64 or dtype.kind != 'f':
+        return values, numpy.zeros(values.shape, dtype=bool)
+    cast = values.astype(dtype)
+    neighbour = numpy.nextafter(cast, numpy.where(values > cast, numpy.inf, -numpy.inf).astype(dtype))
+    ambiguous = (values != cast) & (values == (cast.astype(numpy.float64) + neighbour.astype(numpy.float64)) / 2)
+    return cast, ambiguous
+
+def round_array(arr, sigfigs=None, decimals=None):
+    '''
+    round every element of a NumPy array to either
+        - a given number of significant figures/significant digits, or
+        - a given number of decimals
+    using whole-array arithmetic, returning an array of the same shape & dtype
+
+    Each element gives the same result as round(element, sigfigs=sigfigs) or round(element, decimals=decimals).
+    decimals may also be an array (broadcastable to the shape of arr) giving the decimals for each element.
+    NaN & infinite elements are returned unchanged, while the rare elements whose decimal rounding can't be proven
+    exact in floating point (ie. more than ~15 significant digits, extreme magnitudes) are passed to round() individually.
+    Integer elements rounding to a value outside the range of the dtype raise OverflowError.
+
+    Key usage examples:
+        round_array(numpy.array([2.675, 0.125, -31.45]), sigfigs=2) => array([  2.7 ,   0.13, -31.  ])
+        round_array(numpy.array([2.675, 0.125, -31.45]), decimals=1) => array([  2.7,   0.1, -31.5])
+    '''
+    import numpy
+    from warnings import catch_warnings, simplefilter
+    arr = numpy.asarray(arr)
+    if sigfigs is not None and decimals is not None:
+        warn('Cannot round by both sigfigs & decimals, ignoring decimal constraint', stacklevel=2)
+        decimals = None
+    if sigfigs is not None and sigfigs < 1:
+        warn('cannot have less that 1 significant figure, setting to 1', stacklevel=2)
+        sigfigs = 1
+    if sigfigs is None and decimals is None:
+        return arr.copy()
+    if sigfigs is not None:
+        options = {'sigfigs': int(sigfigs)}
+        decimals = None
+    else:
+        decimals = numpy.broadcast_to(numpy.asarray(decimals, dtype=numpy.int64), arr.shape).ravel()
+        options = None
+    def kwargs(i):
+        '''keyword arguments of round() for element i'''
+        return options or {'decimals': int(decimals[i])}
+    dtype = arr.dtype
+    if dtype.kind == 'O':
+        with catch_warnings():
+            simplefilter('ignore')
+            return numpy.array([round(x, **kwargs(i)) for i, x in enumerate(arr.flat)], dtype=object).reshape(arr.shape)
+    if dtype.kind not in 'iuf' or dtype.itemsize > 8:
+        raise TypeError(f'Invalid array dtype of {dtype}, expecting integer or floating point dtype')
+
+    native = arr.ravel()
+    powers, precision, tiny = _array_table(dtype if dtype.kind == 'f' else numpy.dtype(numpy.float64))
+    exact = numpy.array([float(10**p) for p in range(23)])
+    with numpy.errstate(all='ignore'):
+        x = native.astype(numpy.float64)
+        a = numpy.abs(x)
+        a_native = numpy.abs(native) if dtype.kind == 'f' else a
+        if dtype.kind == 'f':
+            regular = numpy.isfinite(a) & (a_native >= tiny)
+        else:
+            regular = a < 2.0**53
+            precision = 10**6
+
+        mag = numpy.floor(numpy.log10(numpy.where(regular, a, 1))).astype(numpy.int64)
+        mag = numpy.clip(mag, -399, 399)
+        mag -= a_native < powers[mag + 400]
+        mag += a_native >= powers[mag + 401]
+        if sigfigs is not None:
+            d = int(sigfigs) - 1 - mag
+        else:
+            d = decimals.copy()
+        regular &= numpy.abs(d) <= 22
+        d = numpy.where(regular, d, 0)
+        up_scale = exact[numpy.maximum(d, 0)]
+        down_scale = exact[numpy.maximum(-d, 0)]
+
+        r = numpy.floor(a * up_scale / down_scale)
+        regular &= r < 2.0**52
+        halfway, ambiguous = _array_cast(numpy.where(d >= 0, (2*r + 1) / (2*up_scale), (2*r + 1) * (down_scale/2)), dtype)
+        regular &= ~ambiguous
+        tie = a_native == halfway
+        regular &= ~(tie & (mag + d + 2 > precision))
+        q = r + (a_native >= halfway)
+        rounded, ambiguous = _array_cast(numpy.where(d >= 0, q / up_scale, q * down_scale), dtype)
+        regular &= ~ambiguous
+        if dtype.kind != 'f':
+            info = numpy.iinfo(dtype)
+            signed = numpy.copysign(rounded, x)
+            overflow = numpy.flatnonzero(regular & ((signed < info.min) | (signed > info.max)))
+            if overflow.size:
+                i = overflow[0]
+                raise OverflowError(f'{native[i]} rounds to {int(signed[i])}, outside the range of {dtype}')
+
+        result = numpy.where(q == 0, 0, numpy.copysign(rounded, x)).astype(dtype)
+        zero = a == 0
+        if sigfigs is None:
+            result[zero] = numpy.where(decimals[zero] < 0, 0, native[zero])
+        else:
+            result[zero] = native[zero]
+        nonfinite = ~numpy.isfinite(a)
+        result[nonfinite] = native[nonfinite]
+
+    irregular = numpy.flatnonzero(~(regular | zero | nonfinite))
+    if irregular.size:
+        with catch_warnings():
+            simplefilter('ignore')
+            for i in irregular:
+                if dtype.kind == 'f':
+                    result[i] = round(native[i], **kwargs(i))
+                    continue
+                value = round(int(native[i]), **kwargs(i))
+                if not info.min <= value <= info.max:
+                    raise OverflowError(f'{native[i]} rounds to {value}, outside the range of {dtype}')
+                result[i] = value
+    return result.reshape(arr.shape)
+
+def round_with_uncertainty_array(values, uncertainties, numeric=False, **kwargs):
+    '''
+    round every value of a NumPy array to its uncertainty (value & uncertainty arrays are broadcast together)
+    applying the uncertainty cutoff rule (eg. 9, 29 for Drake, 35 for PDG, 99) with whole-array arithmetic.
+
+    Returns either
+        - numeric=False: an array of formatted output (typically strings in ± or bracket notation),
+          each element identical to round(value, uncertainty, **kwargs), or
+        - numeric=True: 2 arrays (rounded values, rounded uncertainties) of the values' dtype,
+          each pair identical to round(value, uncertainty, cutoff=cutoff, sep=tuple) with the cutoff resolved from kwargs
+          (NaN values or uncertainties give NaN in both arrays)
+    Per element warnings aren't issued.  Elements which can't be handled with floating point arithmetic
+    (eg. extreme magnitudes, non-floating point dtypes) are passed to round() individually.
+
+    Key usage examples:
+        round_with_uncertainty_array([123.456, 7.8912], [0.0123, 0.456]) => array(['123.46 ± 0.01', '7.9 ± 0.5'], dtype=object)
+        round_with_uncertainty_array([123.456, 7.8912], [0.0123, 0.456], format='Drake') => array(['123.456(12)', '7.9(5)'], dtype=object)
+        round_with_uncertainty_array([123.456, 7.8912], [0.0123, 0.456], numeric=True) => (array([123.46, 7.9]), array([0.01, 0.5]))
+    '''
+    import numpy
+    from warnings import catch_warnings, simplefilter
+    values, uncertainties = numpy.broadcast_arrays(numpy.asarray(values), numpy.asarray(uncertainties))
+    shape = values.shape
+    x, u = values.ravel(), uncertainties.ravel()
+    if u.dtype.kind in 'iub':
+        u = u.astype(numpy.float64)
+    with catch_warnings():
+        simplefilter('ignore')
+        given = _options_parse(type(x[0]) if x.size else float, (1.0,), kwargs)
+    digits, limit = _cutoff(given)
+
+    unc_digits = numpy.zeros(x.size, dtype=numpy.int64)
+    unc_power = numpy.zeros(x.size, dtype=numpy.int64)
+    regular = numpy.zeros(x.size, dtype=bool)
+    if x.dtype.kind == 'f' and u.dtype.kind == 'f' and x.size:
+        with numpy.errstate(all='ignore'):
+            regular = numpy.isfinite(x) & numpy.isfinite(u)
+            au = numpy.where(regular, numpy.abs(u), 0).astype(u.dtype)
+            powers = _array_table(u.dtype)[0]
+            def mantissa(rounded, sigfigs):
+                '''returns (integer digits, 10's power of last digit) of magnitudes rounded to sigfigs, with their validity'''
+                a = rounded.astype(numpy.float64)
+                mag = numpy.floor(numpy.log10(numpy.where(a > 0, a, 1))).astype(numpy.int64)
+                mag = numpy.clip(mag, -399, 399)
+                mag -= rounded < powers[mag + 400]
+                mag += rounded >= powers[mag + 401]
+                mag[a == 0] = 0
+                power = mag - sigfigs + 1
+                valid = numpy.abs(mag) <= 290
+                return numpy.rint(a / 10.0**numpy.where(valid, power, 0)).astype(numpy.int64), power, valid
+            unc_digits, unc_power, valid = mantissa(round_array(au, sigfigs=digits), digits)
+            regular &= valid
+            over = regular & (unc_digits > limit)
+            if over.any():
+                second, second_power, valid = mantissa(round_array(au[over], sigfigs=digits - 1), digits - 1)
+                regular[over] &= valid
+                leading_one = second // 10**(digits - 2) == 1
+                if digits > 2:
+                    second = numpy.where(leading_one, second - (second // 10**(digits - 3) % 10) * 10**(digits - 3), second)
+                else:
+                    second = numpy.where(leading_one, 10, second)
+                    second_power = numpy.where(leading_one, second_power - 1, second_power)
+                unc_digits[over], unc_power[over] = second, second_power
+
+    if numeric:
+        with numpy.errstate(all='ignore'):
+            dtype = x.dtype if x.dtype.kind == 'f' else numpy.dtype(numpy.float64)
+            rounded = numpy.full(x.size, numpy.nan, dtype=dtype)
+            rounded_unc = numpy.full(x.size, numpy.nan, dtype=dtype)
+            regular &= numpy.abs(unc_power) <= 22
+            if regular.any():
+                exact = numpy.array([float(10**p) for p in range(23)])
+                power = unc_power[regular]
+                magnitude = numpy.where(power >= 0, unc_digits[regular] * exact[numpy.maximum(power, 0)],
+                                        unc_digits[regular] / exact[numpy.maximum(-power, 0)])
+                cast, ambiguous = _array_cast(numpy.copysign(magnitude, u[regular]), dtype)
+                rounded_unc[regular] = cast
+                rounded[regular] = round_array(x[regular], decimals=-power)
+                regular[regular] = ~ambiguous
+            nan = numpy.isnan(x) | numpy.isnan(u)
+        with catch_warnings():
+            simplefilter('ignore')
+            for i in numpy.flatnonzero(~(regular | nan)):
+                rounded[i], rounded_unc[i] = round(x[i], u[i], cutoff=limit, sep=tuple)
+        return rounded.reshape(shape), rounded_unc.reshape(shape)
+
+    output = numpy.empty(x.size, dtype=object)
+    elements = x.tolist() if x.dtype == numpy.float64 else list(x)
+    with catch_warnings():
+        simplefilter('ignore')
+        for i in range(x.size):
+            if regular[i]:
+                num = _num_parse(elements[i])
+                num.round_by_decimals(-int(unc_power[i]))
+                num.has_uncertainty = True
+                unc = _Number()
+                unc.digits = bytearray(str(unc_digits[i]).encode() if unc_digits[i] else b'0' * digits)
+                unc.exponent = int(unc_power[i])
+                unc.negative = bool(u[i] < 0)
+                unc.zero = not unc_digits[i]
+                output[i] = _output(given, num, unc)
+            else:
+                output[i] = round(elements[i], u[i].item() if u.dtype == numpy.float64 else u[i], **kwargs)
+    return output.reshape(shape)
+
+FileInfo = namedtuple('FileInfo', ['path', 'elements', 'bytes', 'seconds', 'bytes_per_second'])
+
+def _file_layout(path, dtype):
+    '''Private function for use only in round_file() function:
+    Returns (dtype, number of elements, byte offset of the data, .npy header as (shape, fortran_order) or None) of a
+    raw binary file of given dtype (float64 by default) or a .npy file (whose header gives the dtype)
+    '''
+    import numpy, os
+    if str(path).endswith('.npy'):
+        mapped = numpy.load(path, mmap_mode='r')
+        stored, elements, offset = mapped.dtype, mapped.size, mapped.offset
+        header = (mapped.shape, mapped.ndim > 1 and not mapped.flags.c_contiguous)
+        del mapped
+        if dtype is not None and numpy.dtype(dtype) != stored:
+            raise TypeError(f'{path} holds {stored} values, not {numpy.dtype(dtype)}')
+        return stored, elements, offset, header
+    dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(f'{path} is {size} bytes long, not a whole number of {dtype} values')
+    return dtype, size // dtype.itemsize, 0, None
+
+def round_file(path, dtype=None, sigfigs=None, decimals=None, out=None, chunksize=1 << 20):
+    '''
+    round every number of a binary column file (raw values of dtype, float64 by default, or a .npy file) to either
+        - a given number of significant figures/significant digits, or
+        - a given number of decimals
+    writing the results to the file out (of the same format) or, by default, back into path in place
+
+    Files are memory-mapped & rounded chunk by chunk (chunksize bytes, rounded up to whole pages) with round_array(),
+    so files of any size are rounded without loading them into memory, each value identical to round(value, sigfigs=sigfigs)
+    or round(value, decimals=decimals).
+
+    Returns FileInfo(path, elements, bytes, seconds, bytes_per_second) of the output.
+
+    Key usage examples:
+        round_file('masses.f64', sigfigs=3, out='masses_3sf.f64') => FileInfo(path='masses_3sf.f64', elements=..., bytes_per_second=...)
+        round_file('temperatures.npy', decimals=2) => rounds temperatures.npy in place
+        round_file('counts.i32', 'int32', decimals=-2)
+    '''
+    import numpy, os, mmap
+    from time import perf_counter
+    from numpy.lib import format as npy
+    start = perf_counter()
+    dtype, elements, offset, header = _file_layout(path, dtype)
+    if dtype.kind not in 'iuf' or dtype.itemsize > 8:
+        raise TypeError(f'Invalid file dtype of {dtype}, expecting integer or floating point dtype')
+    if type(chunksize) != int or chunksize < 1:
+        raise ValueError(f'chunksize must be a positive integer, got {chunksize!r}')
+    if sigfigs is not None and decimals is not None:
+        warn('Cannot round by both sigfigs & decimals, ignoring decimal constraint', stacklevel=2)
+        decimals = None
+    if sigfigs is not None and sigfigs < 1:
+        warn('cannot have less that 1 significant figure, setting to 1', stacklevel=2)
+        sigfigs = 1
+
+    in_place = out is None or os.path.abspath(out) == os.path.abspath(path)
+    if in_place:
+        out, out_offset = path, offset
+    elif header is not None:
+        created = npy.open_memmap(out, mode='w+', dtype=dtype, shape=header[0], fortran_order=header[1])
+        out_offset = created.offset
+        del created
+    else:
+        out_offset = 0
+        with open(out, 'wb') as f:
+            f.truncate(elements * dtype.itemsize)
+
+    page = mmap.ALLOCATIONGRANULARITY
+    chunk = max(page, -(-chunksize // page) * page) // dtype.itemsize
+    first = min(elements, (page - offset % page) % page // dtype.itemsize or chunk)
+    position = 0
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        while position < elements:
+            length = min(first if position == 0 else chunk, elements - position)
+            source = numpy.memmap(path, dtype=dtype, mode='r+' if in_place else 'r', offset=offset + position * dtype.itemsize, shape=(length,))
+            target = source if in_place else numpy.memmap(out, dtype=dtype, mode='r+', offset=out_offset + position * dtype.itemsize, shape=(length,))
+            target[:] = round_array(source, sigfigs=sigfigs, decimals=decimals)
+            target.flush()
+            del source, target
+            position += length
+    seconds = perf_counter() - start
+    size = elements * dtype.itemsize
+    return FileInfo(out, elements, size, seconds, size / seconds if seconds else float('inf'))
+
+_text_digits = r'(?:[0-9]+(?:\.(?P<{0}>[0-9]+))?|\.(?P<{1}>[0-9]+))(?:[EeDdQq](?P<{2}>[+-]?[0-9]+))?(?!\w|\.[0-9]|[-:/]\w)'
+_text_pattern = re.compile(r'(?<![\w.^])(?<!\w[-:/])(?P<value>[+-]?' + _text_digits.format('fraction', 'point', 'exponent') + ')'
+                           r'(?:(?P<separator>[ \t]*(?:±|\+/-|\+-|\\pm)[ \t]*)(?P<uncertainty>' + _text_digits.format('f', 'p', 'e') + ')'
+                           r'|\((?P<brackets>[0-9]+(?:\.[0-9]+)?)\))?')
+_text_glue = frozenset('0123456789.+-:/±\\() \t')
+def _text_cut(buffer, start):
+    '''Private function for use only in _text_stream() function:
+    returns the position after the last character of buffer (from start) which can't belong to a number,
+    ie. other than digits, signs, separators & brackets, exponent letters following a digit or the letters of \\pm
+    '''
+    cut = len(buffer)
+    while cut > start:
+        character = buffer[cut - 1]
+        if character in _text_glue:
+            pass
+        elif character in _exponents:
+            if not buffer[cut - 2:cut - 1].isdigit():
+                break
+        elif character == 'p':
+            if buffer[cut - 2:cut - 1] != '\\':
+                break
+        elif character != 'm' or buffer[cut - 3:cut - 1] != '\\p':
+            break
+        cut -= 1
+    return cut
+_text_styles = {'format', 'style', 'sep', 'separator', 'separation'}
+
+def _text_rounder(kwargs):
+    '''Private function for use only in round_text() function:
+    returns function rounding the text between 2 positions of a buffer (the buffer ending at the 2nd position),
+    rewriting each number (when rounding by sigfigs or decimals) & each value/uncertainty pair found by _text_pattern
+    '''
+    standalone = Rounder(**kwargs) if kwargs.keys() & {'sigfigs', 's', 'decimals', 'd'} else None
+    pair_kwargs = {key: value for key, value in kwargs.items() if key not in {'sigfigs', 's', 'decimals', 'd'}}
+    styled = bool(kwargs.keys() & _text_styles)
+    pairs = {}
+    def rounded(match):
+        value, separator, brackets = match.group('value', 'separator', 'brackets')
+        if separator is not None:
+            uncertainty = match.group('uncertainty')
+        elif brackets is not None:
+            separator = 'brackets'
+            if '.' in brackets:
+                uncertainty = brackets
+            else:
+                decimals = len(match.group('fraction') or match.group('point') or '')
+                uncertainty = f"{brackets}E{int(match.group('exponent') or 0) - decimals}"
+        else:
+            return str(standalone(value)) if standalone else value
+        rounder = pairs.get(separator)
+        if rounder is None:
+            rounder = pairs[separator] = Rounder(**pair_kwargs) if styled else Rounder(**pair_kwargs, sep=separator)
+        return str(rounder(value, uncertainty))
+    def rewrite(buffer, start, end):
+        pieces = []
+        last = start
+        for match in _text_pattern.finditer(buffer, start):
+            if match.start() >= end:
+                break
+            pieces.append(buffer[last:match.start()])
+            pieces.append(rounded(match))
+            last = match.end()
+        pieces.append(buffer[last:end])
+        return ''.join(pieces)
+    return rewrite
+
+def _text_boundary(buffer, start):
+    '''Private function for use only in _text_stream() function:
+    returns the position after the last space or tab of buffer (from start) which no number can span,
+    ie. neither followed by the start of a separator (±, +/-, +-, \\pm) nor following the end of one, else start
+    '''
+    position = len(buffer) - 2
+    while position >= start:
+        if buffer[position] in ' \t' and buffer[position + 1] not in ' \t±+\\':
+            before = position
+            while before > 0 and buffer[before - 1] in ' \t':
+                before -= 1
+            if before > 0 and buffer[before - 1] not in '±-m':
+                return position + 1
+        position -= 1
+    return start
+
+def _text_stream(chunks, rewrite, limit):
+    '''Private function for use only in round_text() function:
+    yields each chunk of text rewritten, holding back any trailing characters which could belong to a number
+    (so no number is split) along with 2 characters of context.
+    Once more than limit characters are held back, the text up to the last space or tab no number can span is rewritten
+    (without one, the held back text is passed through as is) so memory stays bounded
+    '''
+    buffer, start = '', 0
+    for chunk in chunks:
+        buffer += chunk
+        cut = _text_cut(buffer, start)
+        if len(buffer) - cut > limit:
+            cut = _text_boundary(buffer, cut)
+            if cut == start:
+                yield buffer[start:]
+                buffer, start = buffer[-2:], 2
+                continue
+        if cut > start:
+            yield rewrite(buffer, start, cut)
+            keep = max(cut - 2, 0)
+            buffer, start = buffer[keep:], cut - keep
+    if len(buffer) > start:
+        yield rewrite(buffer, start, len(buffer))
+
+def round_text(text, chunksize=1 << 16, **kwargs):
+    '''
+    round every number embedded in text (eg. reports, logs, LaTeX tables) in a single pass, given either
+        - a string, returning the rewritten string, or
+        - a text stream (with a read() method) or an iterable of strings (eg. lines), returning an iterator
+          of rewritten strings, reading chunksize characters at a time so texts of any size use bounded memory
+          (only runs of over chunksize characters which could all belong to 1 number are passed through unrounded)
+
+    Numbers are recognized with the grammar round() accepts (signs, decimals, E/D/Q exponents), except those
+    joined to letters, digits or other numbers (eg. x2, 0x1F, 1.2.3, 2024-01-02, 12:30), & are rounded with the keyword arguments of round()
+    (numbers standing alone are left unchanged unless sigfigs or decimals are given).  Value/uncertainty pairs written
+    x ± y, x +/- y, x +- y, x \\pm y or x(y) are rounded to their uncertainty, keeping their separator
+    unless given a format or separator.
+
+    Key usage examples:
+        round_text('g = 9.80665 m/s^2, T = 2.0417 ± 0.0132 s', sigfigs=3) => 'g = 9.81 m/s^2, T = 2.04 ± 0.01 s'
+        round_text('a = 1.23456(123)', cutoff=29) => 'a = 1.2346(12)'
+        output.writelines(round_text(open('report.tex'), cutoff=29))
+    '''
+    rewrite = _text_rounder(kwargs)
+    if type(chunksize) != int or chunksize < 1:
+        raise ValueError(f'chunksize must be a positive integer, got {chunksize!r}')
+    if isinstance(text, str):
+        return rewrite(text, 0, len(text))
+    if hasattr(text, 'read'):
+        return _text_stream(iter(lambda: text.read(chunksize), ''), rewrite, chunksize)
+    return _text_stream(text, rewrite, chunksize)
+
+_cli_options = None
+def _cli_init(kwargs, columns, uncertainties, split):
+    '''Private function for use only in main() function:
+    sets the rounding options of the current (worker) process once
+    '''
+    global _cli_options
+    _cli_options = Rounder(**kwargs), columns, uncertainties, split
+
+def _cli_rows(rows):
+    '''Private function for use only in main() function:
+    rounds the selected cells of a chunk of rows in place, leaving empty & unparseable cells unchanged
+    '''
+    rounder, columns, uncertainties, split = _cli_options
+    with warning_policy('suppress'):
+        for row in rows:
+            for column, uncertainty in zip(columns, uncertainties):
+                if column >= len(row) or not row[column].strip():
+                    continue
+                try:
+                    if uncertainty is None:
+                        row[column] = rounder(row[column].strip())
+                    elif uncertainty < len(row) and row[uncertainty].strip():
+                        rounded = rounder(row[column].strip(), row[uncertainty].strip())
+                        if split:
+                            row[column], row[uncertainty] = rounded
+                        else:
+                            row[column] = rounded
+                except ValueError:
+                    pass
+    return rows
+
+def main(argv=None):
+    '''
+    command line interface (python -m sigfig or sigfig) which streams a delimited (CSV/TSV) file,
+    rounding the selected columns by sigfigs, decimals or a paired uncertainty column.
+    Rows are read, rounded & written chunksize at a time (optionally across worker processes) so memory is bounded.
+
+    Key usage examples:
+        python -m sigfig data.csv --columns mass,energy --sigfigs 3 > rounded.csv
+        python -m sigfig data.tsv --columns 2 --uncertainty 3 --format Drake -o rounded.tsv
+        cat data.csv | python -m sigfig --columns mass --uncertainty mass_error --split --workers 4
+    '''
+    import argparse, csv, sys
+    from collections import deque
+    from itertools import islice
+    parser = argparse.ArgumentParser(prog='sigfig', description='Round columns of a delimited (CSV/TSV) file with sigfig.round().')
+    parser.add_argument('file', nargs='?', default='-', help='delimited file to read (default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='file to write (default: stdout)')
+    parser.add_argument('-c', '--columns', required=True, help='comma separated names (or 1-based numbers) of the columns to round')
+    rounding = parser.add_mutually_exclusive_group(required=True)
+    rounding.add_argument('-s', '--sigfigs', type=int, help='number of significant figures to round to')
+    rounding.add_argument('-d', '--decimals', type=int, help='number of decimals to round to')
+    rounding.add_argument('-u', '--uncertainty', help='comma separated names (or 1-based numbers) of the uncertainty column paired with each column')
+    parser.add_argument('-f', '--format', choices=list(_formats), help='named format (default: std)')
+    parser.add_argument('--cutoff', type=int, help='uncertainty cutoff (default: 9, or set by --format)')
+    parser.add_argument('--split', action='store_true', help='write rounded uncertainties into their own column instead of alongside the value')
+    parser.add_argument('--delimiter', help='field delimiter (default: tab for .tsv files, otherwise comma)')
+    parser.add_argument('--no-header', action='store_true', help='first row is data rather than column names')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='number of worker processes (default: 1)')
+    parser.add_argument('--chunksize', type=int, default=10000, help='rows per chunk (default: 10000)')
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunksize < 1:
+        parser.error('--workers & --chunksize must be positive')
+
+    delimiter = args.delimiter or ('\t' if args.file.lower().endswith('.tsv') else ',')
+    source = sys.stdin if args.file == '-' else open(args.file, newline='', encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        reader = csv.reader(source, delimiter=delimiter)
+        writer = csv.writer(target, delimiter=delimiter, lineterminator='\n')
+        header = [] if args.no_header else next(reader, [])
+        def index(name):
+            if name in header:
+                return header.index(name)
+            if name.isdigit() and int(name) > 0:
+                return int(name) - 1
+            parser.error(f'unknown column {name!r}')
+        columns = [index(name) for name in args.columns.split(',')]
+        uncertainties = [None] * len(columns)
+        if args.uncertainty:
+            uncertainties = [index(name) for name in args.uncertainty.split(',')]
+            if len(uncertainties) != len(columns):
+                parser.error(f'{len(columns)} columns given with {len(uncertainties)} uncertainty columns')
+        kwargs = {}
+        if args.sigfigs is not None:
+            kwargs['sigfigs'] = args.sigfigs
+        if args.decimals is not None:
+            kwargs['decimals'] = args.decimals
+        if args.format:
+            kwargs['format'] = args.format
+        if args.cutoff is not None:
+            kwargs['cutoff'] = args.cutoff
+        if args.split:
+            kwargs['separator'] = tuple
+        if header:
+            writer.writerow(header)
+
+        chunks = iter(lambda: list(islice(reader, args.chunksize)), [])
+        options = (kwargs, columns, uncertainties, args.split)
+        if args.workers == 1:
+            _cli_init(*options)
+            for chunk in chunks:
+                writer.writerows(_cli_rows(chunk))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_cli_init, initargs=options) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_cli_rows, chunk))
+                    if len(pending) > 2 * args.workers:
+                        writer.writerows(pending.popleft().result())
+                while pending:
+                    writer.writerows(pending.popleft().result())
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
         else:
-            if given['prefix'] and given['prefix'] not in {True, 'major', 'minor', 'all'}:
-                output += num.prefix
-            output += given['separator'] + unc.decimate(given['format'], sign=False)
-            if given['prefix'] == True and units:
-                output = f'({output})'
-    return output + units
+            target.flush()
+    return 0
 
 def roundit(*args, **kwargs):
     '''Depreciated version of round() function with limited scope'''
-    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=_warn_stacklevel(2))
+    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=2)
     defaults = {'spacer': ' ', 'spacing': 3, 'separator': 'brackets', 'output_type' : str}
     final_parameters = defaults
     if 'form' in kwargs:
@@ -722,7 +2352,7 @@ def roundit(*args, **kwargs):
     return round(*args, **final_parameters)
 def round_unc(*args, **kwargs):
     '''Depreciated version of round() function with limited scope'''
-    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=_warn_stacklevel(2))
+    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=2)
     defaults = {'sep': tuple}
     final_parameters = defaults
     if 'form' in kwargs and kwargs['form'] == 'plusminus':
@@ -735,5 +2365,5 @@ def round_unc(*args, **kwargs):
     return round(*[str(arg) for arg in args], **final_parameters)[0]
 def round_sf(number, sigfigs):
     '''Depreciated version of round() function with limited scope'''
-    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=_warn_stacklevel(2))
+    warn('Depreciated Usage: Migrate code to use round() function instead', DeprecationWarning, stacklevel=2)
     return round(str(number),sigfigs=sigfigs)
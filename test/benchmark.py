@@ -0,0 +1,455 @@
+﻿'''Sigfig benchmarking module
+
+Times the sigfig module's entry points against the equivalent round() calls.
+Run directly: python test/benchmark.py [benchmark ...] [--json results.json] [--compare baseline.json]
+'''
+
+from timeit import repeat
+from tracemalloc import start, stop, get_traced_memory
+from warnings import filterwarnings, catch_warnings
+from decimal import Decimal
+from os import cpu_count
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+import json, platform, subprocess, sys, os, re, io
+import asyncio
+
+from numpy import fromfile, float32, float64, int64, __version__ as numpy_version
+from numpy.random import default_rng
+
+from sys import path
+from pathlib import Path
+path.insert(0, str(Path(__file__).parent / "../sigfig"))
+from sigfig import round, round_array, Rounder, _num_parse, _options_parse, _output, settings, set_cache, cache_info, cache_clear, warning_policy, round_many, round_iter, round_parallel, round_with_uncertainty_array, round_many_async, round_file, round_text, _formats, instrument, stats
+
+def best(func, number=1, repeats=3):
+    '''returns best time (seconds) per call of func()'''
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+def bench_import(runs=10, budget_us=30000):
+    '''import sigfig time from -X importtime (best of runs, compiled bytecode cached) against its budget & its slowest imports'''
+    with TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        reports = []
+        for _ in range(runs + 1):
+            stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import sigfig'], capture_output=True, text=True,
+                                    cwd=Path(__file__).parent.parent, env=env).stderr
+            rows = [line.split('|') for line in stderr.splitlines()[1:]]
+            names = [name.strip() for own, total, name in rows]
+            rows = rows[names.index('site') + 1:] if 'site' in names else rows
+            reports.append({name.strip(): (int(own.split(':')[1]), int(total)) for own, total, name in rows})
+    best_report = min(reports[1:], key=lambda report: report['sigfig'][1])
+    slowest = sorted(((own, name) for name, (own, total) in best_report.items() if name != 'sigfig'), reverse=True)[:5]
+    total = best_report['sigfig'][1]
+    print(f"import sigfig: {total/1000:.1f}ms ({'within' if total < budget_us else 'OVER'} {budget_us/1000:.0f}ms budget), "
+          f"slowest: {', '.join(f'{name} {own/1000:.1f}ms' for own, name in slowest)}")
+    return {'total_us': total, 'budget_us': budget_us, 'modules_us': {name: cumulative for name, (own, cumulative) in best_report.items()}}
+
+def bench_chained_map(size=5000):
+    '''round() of output='map' results chained through decreasing precision, vs the same rounding of strings'''
+    rng = default_rng(14)
+    values = [str(x) for x in rng.standard_normal(size) * 10.0**rng.integers(-6, 6, size)]
+    numbers = [round(x, sigfigs=12, output='map') for x in values]
+    def chained():
+        for x in numbers:
+            for sigfigs in (9, 6, 3):
+                x = round(x, sigfigs=sigfigs, output='map')
+    def strings():
+        for x in values:
+            for sigfigs in (9, 6, 3):
+                round(x, sigfigs=sigfigs, output='map')
+    mapped = best(chained) / size / 3
+    text = best(strings) / size / 3
+    copied = best(lambda: [x.copy() for x in numbers]) / size
+    print(f"round(output='map' result): {mapped*1E6:.2f}us vs str {text*1E6:.2f}us per step, _Number.copy() {copied*1E6:.2f}us")
+    return {'chained': mapped, 'str': text, 'copy': copied}
+
+def bench_round_paths(size=2000):
+    '''per call latency of round() for each input type, rounding mode, output & named format'''
+    rng = default_rng(11)
+    floats = rng.standard_normal(size) * 10.0**rng.integers(-6, 6, size)
+    strings = [str(x) for x in floats]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size)) * 10.0**rng.integers(-3, 1, size)]
+    inputs = {'str': strings,
+              'int': [int(x) for x in rng.integers(-10**12, 10**12, size)],
+              'float': [float(x) for x in floats],
+              'Decimal': [Decimal(x) for x in strings],
+              'numpy.float64': [float64(x) for x in floats],
+              'numpy.float32': [float32(x) for x in floats],
+              'numpy.int64': [int64(x) for x in rng.integers(-10**12, 10**12, size)],
+              '_Number': [_num_parse(x) for x in strings]}
+    modes = {'sigfigs': {'sigfigs': 3}, 'decimals': {'decimals': 2},
+             **{f'uncertainty cutoff={cutoff}': {'uncertainty': True, 'cutoff': cutoff} for cutoff in (9, 29, 35, 99)},
+             'prefix': {'sigfigs': 3, 'prefix': True}, 'sci': {'sigfigs': 3, 'notation': 'sci'}, 'eng': {'sigfigs': 3, 'notation': 'eng'},
+             'list': {'uncertainty': True, 'sep': list}, 'tuple': {'uncertainty': True, 'sep': tuple}, 'map': {'sigfigs': 3, 'output': 'map'}}
+    modes.update({f'format={name}': {'uncertainty': True, 'format': name} for name in _formats})
+    results = {}
+    for name, values in inputs.items():
+        results[f'input={name}'] = best(lambda: [round(x, sigfigs=4) for x in values]) / size
+    for name, kwargs in modes.items():
+        if kwargs.get('uncertainty'):
+            options = {key: value for key, value in kwargs.items() if key != 'uncertainty'}
+            seconds = best(lambda: [round(x, u, **options) for x, u in zip(strings, uncertainties)])
+        else:
+            seconds = best(lambda: [round(x, **kwargs) for x in strings])
+        results[name] = seconds / size
+    for name, seconds in results.items():
+        print(f'round() {name}: {seconds*1E6:.2f}us per call')
+    return results
+
+def bench_mixed(size=10**5):
+    '''repeated round() calls over mixed input types & modes (size calls, 10^5 - 10^6)'''
+    rng = default_rng(12)
+    floats = rng.standard_normal(size) * 10.0**rng.integers(-6, 6, size)
+    kinds = (str, float, Decimal, float64, lambda x: int(x * 1000))
+    calls = [((kinds[i % 5](x if i % 5 != 2 else str(x)),), {'sigfigs': 3} if i % 3 == 0 else {'decimals': 2} if i % 3 == 1 else {'uncertainty': str(abs(x) / 100 + 1E-9)})
+             for i, x in enumerate(floats.tolist())]
+    seconds = best(lambda: [round(*args, **kwargs) for args, kwargs in calls], repeats=2) / size
+    print(f'round() mixed inputs & modes: {size} calls {seconds*size:.2f}s, {seconds*1E6:.2f}us per call ({1/seconds:,.0f}/s)')
+    return {'per_call': seconds, 'calls_per_second': 1 / seconds}
+
+def bench_round_array(size=10**6, sample=10**4):
+    '''round_array() vs element by element round() on random float64 data'''
+    data = default_rng(0).standard_normal(size) * 1000
+    sub = data[:sample]
+    results = {}
+    for kwargs in ({'sigfigs': 3}, {'decimals': 2}):
+        vectorized = best(lambda: round_array(data, **kwargs))
+        scalar = best(lambda: [round(x, **kwargs) for x in sub], repeats=1) * size / sample
+        results[str(kwargs)] = (scalar, vectorized)
+        print(f'round_array {kwargs}: {size} elements {vectorized:.3f}s vs round() {scalar:.1f}s (x{scalar/vectorized:.0f})')
+    return results
+
+def bench_round_file(size=2*10**7):
+    '''round_file() throughput (MB/s) vs reading, round_array() & writing the whole column in memory'''
+    data = default_rng(9).standard_normal(size) * 1000
+    results = {}
+    with TemporaryDirectory() as directory:
+        column, rounded = Path(directory, 'column.f64'), Path(directory, 'rounded.f64')
+        data.tofile(column)
+        for kwargs in ({'sigfigs': 3}, {'decimals': 2}):
+            mapped = best(lambda: round_file(column, out=rounded, **kwargs), repeats=2)
+            loaded = best(lambda: round_array(fromfile(column), **kwargs).tofile(rounded), repeats=2)
+            results[str(kwargs)] = (data.nbytes / mapped, data.nbytes / loaded)
+            print(f'round_file {kwargs}: {data.nbytes/mapped/1E6:.0f}MB/s vs in memory {data.nbytes/loaded/1E6:.0f}MB/s')
+    return results
+
+def bench_round_text(lines=2*10**4):
+    '''round_text() of a string & a stream (MB/s) vs re.sub() with a round() call per number'''
+    rng = default_rng(11)
+    text = ''.join(f'run {i}: T = {t:.6f} ± {u:.5f} s, m = {m:.7g}(12) kg at {c:.4f}, see table {i % 7}\n'
+                   for i, t, u, m, c in zip(range(lines), rng.standard_normal(lines) * 100, abs(rng.standard_normal(lines)),
+                                            rng.standard_normal(lines) * 1E-3, rng.standard_normal(lines)))
+    number = re.compile(r'(?<![\w.])[+-]?(?:[0-9]+(?:\.[0-9]+)?|\.[0-9]+)(?:[EeDdQq][+-]?[0-9]+)?(?!\w|\.[0-9])')
+    size = len(text.encode())
+    with catch_warnings():
+        filterwarnings('ignore')
+        scanned = best(lambda: round_text(text, sigfigs=3), repeats=2)
+        streamed = best(lambda: sum(map(len, round_text(io.StringIO(text), sigfigs=3))), repeats=2)
+        substituted = best(lambda: number.sub(lambda match: round(match.group(), sigfigs=3), text), repeats=2)
+    print(f'round_text: {size/scanned/1E6:.2f}MB/s (stream {size/streamed/1E6:.2f}MB/s) vs re.sub() & round() {size/substituted/1E6:.2f}MB/s')
+    return {'string': size / scanned, 'stream': size / streamed, 're.sub': size / substituted}
+
+def bench_rounder(size=2000):
+    '''precompiled Rounder vs round() for the default & named formats'''
+    rng = default_rng(1)
+    values = [str(x) for x in rng.standard_normal(size) * 1000]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size))]
+    results = {}
+    for kwargs in ({}, {'format': 'Drake'}, {'format': 'PDG'}, {'format': 'eng'}):
+        rounder = Rounder(**kwargs)
+        plain = best(lambda: [round(x, u, **kwargs) for x, u in zip(values, uncertainties)]) / size
+        compiled = best(lambda: [rounder(x, u) for x, u in zip(values, uncertainties)]) / size
+        results[str(kwargs)] = (plain, compiled)
+        print(f'Rounder {kwargs}: {compiled*1E6:.1f}us vs round() {plain*1E6:.1f}us per call (x{plain/compiled:.2f})')
+    return results
+
+def bench_number(size=10**4):
+    '''_Number memory footprint & parse/round/decimate speed'''
+    values = [f'{i}.{i*7 % 10**6:06d}' for i in range(size)]
+    start()
+    numbers = [_num_parse(x) for x in values]
+    memory = get_traced_memory()[0] / size
+    stop()
+    parse = best(lambda: [_num_parse(x) for x in values]) / size
+    rounding = best(lambda: [n.round_by_decimals(2) for n in [_num_parse(x) for x in values]]) / size - parse
+    decimate = best(lambda: [n.decimate({'decimal': '.', 'spacer': ' ', 'spacing': 3}) for n in numbers]) / size
+    print(f'_Number: {memory:.0f} bytes, parse {parse*1E6:.1f}us, round {rounding*1E6:.1f}us, decimate {decimate*1E6:.1f}us')
+    return {'bytes': memory, 'parse': parse, 'round': rounding, 'decimate': decimate}
+
+def bench_long_input():
+    '''round() cost vs mantissa length (10 - 10^4 digits) & exponent size (up to 10^6)'''
+    results = {}
+    for length in (10, 100, 1000, 10**4):
+        mantissa = ''.join(str(i*7 % 10) for i in range(length))
+        for exponent in (0, 10**3, 10**6, -10**6):
+            number = f'{mantissa[0]}.{mantissa[1:]}E{exponent}'
+            seconds = best(lambda: round(number, sigfigs=length//2, notation='sci'), number=20)
+            results[f'{length} digits E{exponent}'] = seconds
+            print(f'round({length} digits E{exponent}, sigfigs={length//2}, notation=sci): {seconds*1E6:.1f}us ({seconds/length*1E9:.0f}ns/digit)')
+    return results
+
+def bench_input_types(size=10**4):
+    '''round() throughput per input type vs the same numbers given as strings'''
+    rng = default_rng(2)
+    floats = rng.standard_normal(size) * 10.0**rng.integers(-8, 8, size)
+    inputs = {'float': [float(x) for x in floats],
+              'int': [int(x) for x in rng.integers(-10**12, 10**12, size)],
+              'Decimal': [Decimal(repr(float(x))) for x in floats],
+              'numpy.float64': list(floats),
+              'numpy.float32': list(floats.astype('float32')),
+              'numpy.int64': list(rng.integers(-10**12, 10**12, size))}
+    results = {}
+    for name, values in inputs.items():
+        strings = [str(x) for x in values]
+        direct = best(lambda: [round(x, sigfigs=4) for x in values]) / size
+        text = best(lambda: [round(x, sigfigs=4) for x in strings]) / size
+        results[name] = (text, direct)
+        print(f'round({name}, sigfigs=4): {1/direct:,.0f}/s vs str {1/text:,.0f}/s (x{text/direct:.2f})')
+    return results
+
+def bench_cache(size=10**5, distinct=2000):
+    '''round() with & without the result cache on repetitive readings'''
+    rng = default_rng(3)
+    readings = [float(x) for x in (rng.standard_normal(distinct) * 100).round(3)]
+    values = [readings[i] for i in rng.integers(0, distinct, size)]
+    results = {}
+    for kwargs in ({'sigfigs': 3}, {'uncertainty': 0.0123, 'format': 'Drake'}):
+        plain = best(lambda: [round(x, **kwargs) for x in values]) / size
+        set_cache(4096)
+        cached = best(lambda: [round(x, **kwargs) for x in values]) / size
+        info = cache_info()
+        set_cache(0)
+        cache_clear()
+        results[str(kwargs)] = (plain, cached)
+        print(f'cache {kwargs}: {cached*1E6:.2f}us vs {plain*1E6:.2f}us per call (x{plain/cached:.1f}, {info.hits/(info.hits+info.misses):.0%} hits)')
+    return results
+
+def bench_warnings(size=10**4):
+    '''round() on messy data where most rows warn, per warning policy'''
+    values = [str(i % 100) if i % 3 else '' for i in range(size)]
+    results = {}
+    with catch_warnings():
+        filterwarnings('ignore')
+        results['default'] = best(lambda: [round(x, sigfigs=4) for x in values]) / size
+    for policy in ('suppress', 'count', 'collect'):
+        def batch():
+            with warning_policy(policy):
+                return [round(x, sigfigs=4) for x in values]
+        results[policy] = best(batch) / size
+    for policy, seconds in results.items():
+        print(f'warning policy {policy}: {seconds*1E6:.2f}us per call (x{results["default"]/seconds:.2f})')
+    return results
+
+def bench_round_many(size=10**5):
+    '''round_many() vs a round() loop catching exceptions & warnings on a column with bad cells'''
+    rng = default_rng(4)
+    column = [str(x) for x in rng.standard_normal(size) * 1000]
+    for i in rng.integers(0, size, size // 20):
+        column[i] = ('n/a', '', 'nan', '1.2.3')[i % 4]
+    def loop():
+        results = []
+        with catch_warnings():
+            filterwarnings('ignore')
+            for x in column:
+                try:
+                    results.append(round(x, sigfigs=3))
+                except ValueError:
+                    results.append(None)
+        return results
+    looped = best(loop) / size
+    batched = best(lambda: round_many(column, sigfigs=3)) / size
+    print(f'round_many: {batched*1E6:.2f}us vs round() loop {looped*1E6:.2f}us per element (x{looped/batched:.2f})')
+    return looped, batched
+
+def bench_round_iter(size=10**5):
+    '''round_iter() vs a round() loop over streams of Python floats & NumPy scalars'''
+    data = default_rng(5).standard_normal(size) * 1000
+    results = {}
+    for name, stream in (('float', [float(x) for x in data]), ('numpy.float64', list(data))):
+        looped = best(lambda: [round(x, sigfigs=3) for x in stream], repeats=1) / size
+        streamed = best(lambda: sum(1 for _ in round_iter(iter(stream), sigfigs=3)), repeats=1) / size
+        results[name] = (looped, streamed)
+        print(f'round_iter({name}, sigfigs=3): {streamed*1E6:.2f}us vs round() loop {looped*1E6:.2f}us per element (x{looped/streamed:.1f})')
+    return results
+
+def bench_round_parallel(size=2*10**5):
+    '''round_parallel() scaling efficiency (speedup / workers) for Drake formatted value/uncertainty pairs'''
+    rng = default_rng(6)
+    values = [str(x) for x in rng.standard_normal(size) * 1000]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size))]
+    results = {}
+    serial = best(lambda: round_parallel(values, uncertainties, workers=1, format='Drake'), repeats=1)
+    workers = 2
+    while workers <= max(2, cpu_count() or 1):
+        seconds = best(lambda: round_parallel(values, uncertainties, workers=workers, format='Drake'), repeats=1)
+        results[workers] = (seconds, serial / seconds / workers)
+        print(f'round_parallel workers={workers}: {seconds:.2f}s vs {serial:.2f}s in process (x{serial/seconds:.2f}, {serial/seconds/workers:.0%} efficiency)')
+        workers *= 2
+    return results
+
+def bench_round_many_async(size=10**5):
+    '''round_many_async() vs round_many() called within a coroutine: total time & longest event loop stall'''
+    rng = default_rng(1)
+    values = [str(x) for x in rng.standard_normal(size) * 10.0**rng.integers(-6, 6, size)]
+    async def stalls(rounding):
+        longest, running = 0.0, True
+        async def heartbeat():
+            nonlocal longest
+            last = perf_counter()
+            while running:
+                await asyncio.sleep(0)
+                now = perf_counter()
+                longest, last = max(longest, now - last), now
+        beating = asyncio.ensure_future(heartbeat())
+        await asyncio.sleep(0)
+        start = perf_counter()
+        await rounding()
+        total, running = perf_counter() - start, False
+        await beating
+        return total, longest
+    async def inline():
+        return round_many(values, sigfigs=3)
+    results = {}
+    for name, rounding in (('round_many()', inline), ('round_many_async()', lambda: round_many_async(values, sigfigs=3))):
+        results[name] = asyncio.run(stalls(rounding))
+        print(f'{name}: {results[name][0]*1E3:.0f}ms total, longest event loop stall {results[name][1]*1E3:.1f}ms')
+    return results
+
+def bench_round_with_uncertainty_array(size=10**5, sample=10**4):
+    '''round_with_uncertainty_array() vs element by element round(value, uncertainty), as strings & numbers'''
+    rng = default_rng(7)
+    values = rng.standard_normal(size) * 1000
+    uncertainties = abs(rng.standard_normal(size))
+    x, u = values[:sample], uncertainties[:sample]
+    results = {}
+    for kwargs in ({}, {'format': 'Drake'}, {'format': 'PDG'}):
+        scalar = best(lambda: [round(a, b, **kwargs) for a, b in zip(x, u)], repeats=1) * size / sample
+        strings = best(lambda: round_with_uncertainty_array(values, uncertainties, **kwargs), repeats=1)
+        numeric = best(lambda: round_with_uncertainty_array(values, uncertainties, numeric=True, **kwargs))
+        results[str(kwargs)] = (scalar, strings, numeric)
+        print(f'round_with_uncertainty_array {kwargs}: {size} pairs {strings:.2f}s strings, {numeric:.3f}s numeric vs round() {scalar:.2f}s (x{scalar/strings:.1f}, x{scalar/numeric:.0f})')
+    return results
+
+def bench_instrument(size=10**4):
+    '''round() per call cost with instrument() disabled, enabled & after disabling again'''
+    rng = default_rng(13)
+    values = [str(x) for x in rng.standard_normal(size) * 1000]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size))]
+    results = {}
+    for name, kwargs, args in (('sigfigs', {'sigfigs': 3}, lambda: zip(values)), ('uncertainty', {'format': 'Drake'}, lambda: zip(values, uncertainties))):
+        before = best(lambda: [round(*x, **kwargs) for x in args()]) / size
+        instrument()
+        enabled = best(lambda: [round(*x, **kwargs) for x in args()]) / size
+        instrument(False)
+        stats(clear=True)
+        after = best(lambda: [round(*x, **kwargs) for x in args()]) / size
+        results[name] = (before, enabled, after)
+        print(f'instrument {name}: {before*1E6:.2f}us disabled, {enabled*1E6:.2f}us enabled (x{enabled/before:.2f}), {after*1E6:.2f}us disabled again')
+    return results
+
+def bench_formatter(size=10**4):
+    '''string formatting (the _output() stage after rounding) per named format for value/uncertainty pairs'''
+    rng = default_rng(8)
+    values = [str(x) for x in rng.standard_normal(size) * 10.0**rng.integers(-6, 9, size)]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size)) * 10.0**rng.integers(-8, 4, size)]
+    results = {}
+    for name in ('English', 'French', 'Drake', 'PDG'):
+        given = _options_parse(str, (), {'format': name, 'uncertainty': '1'})
+        pairs = [[_num_parse(y) for y in round(x, u, cutoff=given['cutoff'], sep=tuple)] for x, u in zip(values, uncertainties)]
+        seconds = best(lambda: [_output(given, num, unc) for num, unc in pairs]) / size
+        results[name] = seconds
+        print(f'format={name}: {seconds*1E6:.2f}us per value ± uncertainty output')
+    return results
+
+def bench_prefixes(exponents=range(-60, 61)):
+    '''_Number.prefixify() (SI prefixes, scientific & engineering notation) over exponents from -60 to +60'''
+    numbers = [_num_parse(f'{m}E{e}') for e in exponents for m in ('1.5', '-7.25', '3')]
+    def convert(prefix):
+        for number in numbers:
+            number.increment_power_by(-number.prefixify(prefix, 'E'))
+    results = {}
+    for prefix in (True, 'all', 'eng', 'sci'):
+        seconds = best(lambda: convert(prefix), number=10) / len(numbers)
+        results[prefix] = seconds
+        print(f'prefixify({prefix}) E{min(exponents)} - E{max(exponents)}: {seconds*1E6:.2f}us per number')
+    return results
+
+def bench_engines(size=5000):
+    '''round() with the default & decimal engines on numeric strings & Decimals'''
+    rng = default_rng(9)
+    strings = [str(x) for x in rng.standard_normal(size) * 1000]
+    inputs = {'str': strings, 'Decimal': [Decimal(x) for x in strings]}
+    results = {}
+    for name, values in inputs.items():
+        for kwargs in ({'sigfigs': 3}, {'decimals': 2}, {'uncertainty': '0.0123'}):
+            number = best(lambda: [round(x, **kwargs) for x in values]) / size
+            decimal = best(lambda: [round(x, engine='decimal', **kwargs) for x in values]) / size
+            results[f'{name} {kwargs}'] = (number, decimal)
+            print(f"round({name}, {kwargs}): engine='decimal' {decimal*1E6:.2f}us vs {number*1E6:.2f}us per call (x{number/decimal:.2f})")
+    return results
+
+def bench_settings(size=10**4):
+    '''round() with format options given per call vs resolved once by a settings() block'''
+    rng = default_rng(10)
+    values = [str(x) for x in rng.standard_normal(size) * 1000]
+    uncertainties = [str(x) for x in abs(rng.standard_normal(size))]
+    results = {}
+    for kwargs in ({'format': 'Drake'}, {'spacing': 3, 'spacer': ',', 'cutoff': 29}):
+        per_call = best(lambda: [round(x, u, **kwargs) for x, u in zip(values, uncertainties)]) / size
+        def block():
+            with settings(**kwargs):
+                return [round(x, u) for x, u in zip(values, uncertainties)]
+        scoped = best(block) / size
+        results[str(kwargs)] = (per_call, scoped)
+        print(f'settings({kwargs}): {scoped*1E6:.2f}us vs per call {per_call*1E6:.2f}us (x{per_call/scoped:.2f})')
+    default = best(lambda: [round(x, u) for x, u in zip(values, uncertainties)]) / size
+    print(f'round() default settings: {default*1E6:.2f}us per call')
+    results['default'] = default
+    return results
+
+def _metrics(results, prefix=''):
+    '''flattens nested benchmark results into {"benchmark/key/index": number}'''
+    if isinstance(results, dict):
+        return {name: value for key, item in results.items() for name, value in _metrics(item, f'{prefix}/{key}' if prefix else str(key)).items()}
+    if isinstance(results, (list, tuple)):
+        return {name: value for i, item in enumerate(results) for name, value in _metrics(item, f'{prefix}/{i}').items()}
+    return {prefix: float(results)} if isinstance(results, (int, float)) else {}
+
+def compare(baseline, results):
+    '''prints each metric shared by 2 saved result files as baseline -> current (current/baseline)'''
+    old, new = _metrics(baseline['results']), _metrics(results['results'])
+    print(f"\ncompared with {baseline['meta']['sigfig']} ({baseline['meta']['date']}):")
+    for name in [name for name in old if name in new]:
+        ratio = new[name] / old[name] if old[name] else float('nan')
+        print(f'{name}: {old[name]:.4g} -> {new[name]:.4g} (x{ratio:.2f})')
+
+def run(names=None):
+    '''runs the given (or all) benchmarks, returning their results with the environment they were measured in'''
+    pyproject = (Path(__file__).parent / '../pyproject.toml').read_text()
+    sigfig_version = next((line.split('"')[1] for line in pyproject.splitlines() if line.startswith('version = ')), 'unknown')
+    benchmarks = {name[6:]: func for name, func in globals().items() if name.startswith('bench_')}
+    results = {}
+    for name in names or benchmarks:
+        results[name] = benchmarks[name]()
+    meta = {'sigfig': sigfig_version, 'python': platform.python_version(), 'numpy': numpy_version,
+            'platform': platform.platform(), 'cpus': cpu_count(), 'date': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+    return {'meta': meta, 'results': results}
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Times sigfig, optionally saving machine readable results to compare between versions')
+    parser.add_argument('benchmarks', nargs='*', help='benchmarks to run (eg. round_paths mixed cache), all by default')
+    parser.add_argument('--json', help='save results (seconds per call unless stated otherwise) to this JSON file')
+    parser.add_argument('--compare', help='JSON file of earlier results to compare with')
+    options = parser.parse_args()
+    filterwarnings('ignore')
+    results = run(options.benchmarks)
+    if options.json:
+        with open(options.json, 'w') as file:
+            json.dump(results, file, indent=1, default=float)
+    if options.compare:
+        with open(options.compare) as file:
+            compare(json.load(file), results)
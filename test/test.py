@@ -8,16 +8,23 @@ Requires the following semi-colon separated CSV files:
 '''
 
 from decimal import Decimal
-from warnings import warn, filterwarnings, resetwarnings
+from warnings import warn, filterwarnings, resetwarnings, catch_warnings, simplefilter
 from inspect import currentframe, getframeinfo
 import unittest, csv
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import count, islice
+from tempfile import TemporaryDirectory
+import subprocess, sys
+import asyncio, io
+from array import array as pyarray
 
-from numpy import float64, float32, int64, int32, nan, isnan
+from numpy import float64, float32, float16, int64, int32, int8, uint8, uint64, iinfo, inf, nan, isnan, isinf, signbit, array, concatenate, fromfile, save, load, array_equal
+from numpy.random import default_rng
 
 from sys import path
 from pathlib import Path
 path.insert(0, str(Path(__file__).parent / "../sigfig"))
-from sigfig import round, _num_parse, roundit, round_unc, round_sf
+from sigfig import round, _num_parse, _options_parse, roundit, round_unc, round_sf, round_array, Rounder, set_cache, cache_info, cache_clear, set_warning_policy, warning_policy, round_many, Status, round_iter, round_parallel, main, round_with_uncertainty_array, settings, round_many_async, round_iter_async, round_file, round_text, instrument, stats
 
 def function_parse(func):
     '''Comprehends string representation of function call to
@@ -49,6 +56,16 @@ class KnownGood(unittest.TestCase):
         else:
             self.assertEqual(round(*self.args, **self.kwargs), self.output)
 
+class KnownGoodRounder(KnownGood):
+    '''Compares repeated calls of a precompiled Rounder with expected output'''
+    def runTest(self):
+        rounder = Rounder(**self.kwargs)
+        for _ in range(2):
+            if type(self.output) == float:
+                self.assertAlmostEqual(rounder(*self.args), self.output)
+            else:
+                self.assertEqual(rounder(*self.args), self.output)
+
 class KnownGrtr(unittest.TestCase):
     '''Runs each test of _Number's ">" operator'''
     def __init__(self, x, y, z):
@@ -59,6 +76,15 @@ class KnownGrtr(unittest.TestCase):
     def runTest(self):
         self.assertEqual(_num_parse(self.x) > _num_parse(self.y), self.z)
 
+class KnownMap(unittest.TestCase):
+    '''Compares _Number's compatibility .map view with expected power to digit mapping'''
+    def __init__(self, x, z):
+        super(KnownMap, self).__init__()
+        self.x = x
+        self.z = z
+    def runTest(self):
+        self.assertEqual(_num_parse(self.x).map, self.z)
+
 class KnownWarn(unittest.TestCase):
     '''Compares each run of round() with expected output & proper warning message'''
     def __init__(self, args, kwargs, output):
@@ -106,6 +132,624 @@ class TestNaN(unittest.TestCase):
         assert(isnan(round(*self.args, **self.kwargs)))
         resetwarnings()
 
+class TestArray(unittest.TestCase):
+    '''Compares round_array() with element by element round() for a given dtype'''
+    def __init__(self, dtype, kwargs):
+        super(TestArray, self).__init__()
+        self.dtype = dtype
+        self.kwargs = kwargs
+    def runTest(self):
+        rng = default_rng(2718)
+        spread = rng.standard_normal(500) * 10.0**rng.integers(-12, 12, 500)
+        ties = array([float(f'{m}5E{p}') for m, p in zip(rng.integers(-9999, 9999, 500), rng.integers(-8, 4, 500))])
+        edges = array([0.0, -0.0, nan, 0.5, 2.5, -2.675, 9.995, 99.95, 1E-30, 5E-324, 123456789012345678.0])
+        arr = concatenate([spread, ties, edges]).astype(self.dtype)
+        arr = arr[~isinf(arr)]
+        rounded = round_array(arr, **self.kwargs)
+        self.assertEqual(rounded.dtype, arr.dtype)
+        filterwarnings("ignore")
+        for x, y in zip(arr, rounded):
+            expected = round(x, **self.kwargs)
+            if isnan(expected):
+                self.assertTrue(isnan(y))
+            else:
+                self.assertEqual((y, signbit(y)), (expected, signbit(expected)), f'round_array() mismatch for {x!r}')
+        resetwarnings()
+
+class TestArrayBounds(unittest.TestCase):
+    '''Checks round_array() of integers at the bounds of their dtype (raising OverflowError when rounding out of range)
+    & of infinite values (returned unchanged)'''
+    def runTest(self):
+        filterwarnings("ignore")
+        for dtype in (int8, uint8, int32, uint64):
+            info = iinfo(dtype)
+            for value in (info.min, info.min + 1, info.max - 1, info.max):
+                for sigfigs in (1, 2, 3):
+                    expected = round(int(value), sigfigs=sigfigs)
+                    if info.min <= expected <= info.max:
+                        self.assertEqual(round_array(array([value, 0], dtype), sigfigs=sigfigs).tolist(), [expected, 0], (dtype, value))
+                    else:
+                        self.assertRaises(OverflowError, round_array, array([0, value], dtype), sigfigs=sigfigs)
+        self.assertRaises(OverflowError, round_array, array([253], uint8), sigfigs=1)
+        self.assertRaises(OverflowError, round_array, array([2147355719], int32), sigfigs=3)
+        self.assertRaises(OverflowError, round_array, array([2**64 - 1], uint64), sigfigs=1)
+        self.assertRaises(OverflowError, round_array, array([-128], int8), decimals=-1)
+        for dtype in (float64, float32, float16):
+            rounded = round_array(array([1.5, inf, -inf, nan], dtype), sigfigs=1)
+            self.assertEqual((rounded.dtype, rounded[:3].tolist()), (dtype, [2.0, inf, -inf]))
+            self.assertTrue(isnan(rounded[3]))
+        self.assertEqual(list(round_iter([float64(1.26), float64(inf), float64(-inf)], sigfigs=2)), [1.3, inf, -inf])
+        resetwarnings()
+
+class TestFile(unittest.TestCase):
+    '''Compares round_file() of raw binary & .npy files (to a new file & in place) with round_array() of the whole column'''
+    def runTest(self):
+        rng = default_rng(1123)
+        floats = rng.standard_normal(20011) * 10.0**rng.integers(-8, 8, 20011)
+        filterwarnings("ignore")
+        with TemporaryDirectory() as directory:
+            raw, npy = Path(directory, 'column.bin'), Path(directory, 'column.npy')
+            for values in (floats, floats.astype(float32), rng.integers(-10**9, 10**9, 20011).astype(int32)):
+                for kwargs in ({'sigfigs': 3}, {'decimals': 2}, {'decimals': -2}):
+                    expected = round_array(values, **kwargs)
+                    values.tofile(raw)
+                    info = round_file(raw, values.dtype, out=Path(directory, 'rounded.bin'), chunksize=5000, **kwargs)
+                    self.assertTrue(array_equal(fromfile(info.path, values.dtype), expected, equal_nan=values.dtype.kind == 'f'), kwargs)
+                    self.assertEqual((info.elements, info.bytes), (values.size, values.nbytes))
+                    save(npy, values.reshape(-1, 1))
+                    info = round_file(npy, out=Path(directory, 'rounded.npy'), chunksize=20000, **kwargs)
+                    self.assertTrue(array_equal(load(info.path), expected.reshape(-1, 1), equal_nan=values.dtype.kind == 'f'), kwargs)
+                    round_file(npy, **kwargs)
+                    self.assertTrue(array_equal(load(npy), expected.reshape(-1, 1), equal_nan=values.dtype.kind == 'f'), kwargs)
+            raw.write_bytes(b'\0' * 12)
+            self.assertRaises(ValueError, round_file, raw, sigfigs=2)
+            self.assertRaises(TypeError, round_file, npy, float64, sigfigs=2)
+            self.assertRaises(TypeError, round_file, raw, 'U1', sigfigs=2)
+        resetwarnings()
+
+class TestText(unittest.TestCase):
+    '''Checks round_text() of a document against known output, & of streams & lines against the whole string'''
+    def runTest(self):
+        filterwarnings("ignore")
+        text = ('Run 2024-01-02 12:30 (v1.2.3, x2, 0x1F, H2O): g = 9.80665 m/s^2 & E = -1.23456E-3 +/- 2.5e-5 J\n'
+                '$3.14159 \\pm 0.002$ & 12.34567+-0.0456 & 1.23456(123) & 123.45(1.2) & -7.77±1.1, 42 items, .5 and 7.\n')
+        self.assertEqual(round_text(text, sigfigs=2),
+                         'Run 2024-01-02 12:30 (v1.2.3, x2, 0x1F, H2O): g = 9.8 m/s^2 & E = -0.00123 +/- 0.00003 J\n'
+                         '$3.142 \\pm 0.002$ & 12.35+-0.05 & 1.235(1) & 123(1) & -8±1, 42 items, 0.50 and 7.0.\n')
+        self.assertEqual(round_text(text, cutoff=29),
+                         'Run 2024-01-02 12:30 (v1.2.3, x2, 0x1F, H2O): g = 9.80665 m/s^2 & E = -0.001235 +/- 0.000025 J\n'
+                         '$3.1416 \\pm 0.0020$ & 12.35+-0.05 & 1.2346(12) & 123.5(1.2) & -7.8±1.1, 42 items, .5 and 7.\n')
+        self.assertEqual(round_text('1.23456 ± 0.0123, 2.5(3)', format='Drake'), '1.235(12), 2.5(3)')
+        self.assertEqual(round_text('', sigfigs=2), '')
+        for kwargs in ({}, {'sigfigs': 3}, {'decimals': 1, 'sep': 'brackets'}):
+            expected = round_text(text * 20, **kwargs)
+            for chunksize in (24, 64, 1 << 16):
+                self.assertEqual(''.join(round_text(io.StringIO(text * 20), chunksize=chunksize, **kwargs)), expected, (kwargs, chunksize))
+            self.assertEqual(''.join(round_text((text * 20).splitlines(True), **kwargs)), expected, kwargs)
+        self.assertEqual(max(len(chunk) for chunk in round_text(io.StringIO(text.replace('\n', ' ') * 500), chunksize=100, sigfigs=2)) < 200, True)
+        runs = ' '.join(['7' * 5000, '1.23456', '.' * 5000, '9.87 ± 0.123', '2.5 ' * 2000, '3.14159'])
+        chunks = list(round_text(io.StringIO(runs), chunksize=64, sigfigs=2))
+        self.assertTrue(max(len(chunk) for chunk in chunks) < 200)
+        self.assertEqual(''.join(chunks), ' '.join(['7' * 5000, '1.2', '.' * 5000, '9.9 ± 0.1', '2.5 ' * 2000, '3.1']))
+        self.assertRaises(ValueError, round_text, text, chunksize=0)
+        resetwarnings()
+
+class TestUncertaintyArray(unittest.TestCase):
+    '''Compares round_with_uncertainty_array() with element by element round(value, uncertainty)'''
+    def __init__(self, dtype, kwargs):
+        super(TestUncertaintyArray, self).__init__()
+        self.dtype = dtype
+        self.kwargs = kwargs
+    def runTest(self):
+        rng = default_rng(577)
+        x = rng.standard_normal(300) * 10.0**rng.integers(-12, 12, 300)
+        u = rng.standard_normal(300) * 10.0**rng.integers(-14, 10, 300)
+        u[:30] = u[:30].round(3)
+        u[30:40] = [0.0951, 0.0996, 0.0295, 0.0345, 0.35, 0.355, 0.995, 0.9951, 0.0, -0.0]
+        x[40:45] = 0.0
+        x[45], u[46] = nan, nan
+        x, u = x.astype(self.dtype), u.astype(self.dtype)
+        filterwarnings("ignore")
+        expected = [round(a, b, **self.kwargs) for a, b in zip(x, u)]
+        self.assertEqual([str(r) for r in round_with_uncertainty_array(x, u, **self.kwargs)], [str(r) for r in expected])
+        cutoff = self.kwargs.get('cutoff', {'Drake': 29, 'PDG': 35}.get(self.kwargs.get('format'), 9))
+        values, uncertainties = round_with_uncertainty_array(x.reshape(20, 15), u.reshape(20, 15), numeric=True, **self.kwargs)
+        self.assertEqual((values.shape, values.dtype, uncertainties.dtype), ((20, 15), x.dtype, x.dtype))
+        for a, b, value, uncertainty in zip(x, u, values.ravel(), uncertainties.ravel()):
+            if isnan(a) or isnan(b):
+                self.assertTrue(isnan(value) and isnan(uncertainty))
+            else:
+                self.assertEqual((value, uncertainty, signbit(uncertainty)), (*round(a, b, cutoff=cutoff, sep=tuple), signbit(b)))
+        resetwarnings()
+
+class TestThreads(unittest.TestCase):
+    '''Compares round() hammered from a thread pool with serial round()'''
+    def runTest(self):
+        rng = default_rng(31415)
+        calls = []
+        for x, u in zip(rng.standard_normal(4000) * 10.0**rng.integers(-6, 6, 4000), abs(rng.standard_normal(4000))):
+            calls += [((str(x),), {'sigfigs': 3}), ((x,), {'decimals': 2}), ((str(x), str(u)), {'format': 'Drake'})]
+        calls.append((('9' * 5000 + '.5',), {'sigfigs': 4, 'notation': 'sci'}))
+        expected = [round(*args, **kwargs) for args, kwargs in calls]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(3):
+                results = list(pool.map(lambda call: round(*call[0], **call[1]), calls, chunksize=7))
+                self.assertEqual(results, expected)
+
+class TestSettings(unittest.TestCase):
+    '''Compares round() within settings() blocks with round() given the same keyword arguments, per thread & asyncio task'''
+    def runTest(self):
+        filterwarnings("ignore")
+        options = [{'format': 'Drake'}, {'format': 'PDG', 'prefix': True}, {'spacing': 3, 'spacer': ',', 'decimal': '.'},
+                   {'sep': 'external_brackets', 'cutoff': 29}, {'notation': 'eng'}, {'engine': 'decimal', 'crop': 99}]
+        calls = [(('123456.789099', '-1.15E-4'), {}), (('-0.00123456',), {'sigfigs': 3}), (('98765.4321', '12.3'), {'sep': tuple}),
+                 ((1234.5678,), {'decimals': 2}), ((1234.5678, 0.0123), {}), (('1.5', '0.25'), {'sep': '+/-', 'cutoff': 9})]
+        for kwargs in options:
+            with settings(**kwargs):
+                for args, call in calls:
+                    expected = round(*args, **dict(kwargs, **call)) if type(args[0]) is str or len(args) > 1 else round(*args, **call)
+                    self.assertEqual(round(*args, **call), expected, (args, call, kwargs))
+        with settings(format='Drake'):
+            with settings(cutoff=9, prefix=True):
+                self.assertEqual(round('123456.789099', '-1.15E-4'), '123.456 789 1(1)k')
+            with self.assertRaises(ValueError), settings(spacer=','):
+                round('x')
+            self.assertEqual(round('123456.789099', '-1.15E-4'), '123 456.789 10(12)')
+        self.assertEqual(round('123456.789099', '-1.15E-4'), '123456.7891 ± 0.0001')
+        rounder = Rounder()
+        for kwargs in [{}] + options + [{}]:
+            with settings(**kwargs):
+                for args, call in calls:
+                    self.assertEqual(Rounder(**call)(*args), round(*args, **call), (args, call, kwargs))
+                self.assertEqual(rounder('123456.789099', '-1.15E-4'), round('123456.789099', '-1.15E-4'), kwargs)
+        set_cache(10)
+        with settings(decimal=','):
+            self.assertEqual(round('2.675', sigfigs=2), '2,7')
+        self.assertEqual(round('2.675', sigfigs=2), '2.7')
+        set_cache(0)
+        cache_clear()
+        def threaded(format):
+            with settings(format=format):
+                return [round('1234.5678', '0.0123') for _ in range(200)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(threaded, ['Drake', 'PDG', 'French', 'English'] * 4))
+        self.assertEqual({r for result in results for r in result}, {'1 234.568(12)', '1234.568 ± 0.012', '1 234,568 ± 0,012', '1,234.57 ± 0.01'})
+        self.assertTrue(all(len(set(result)) == 1 for result in results))
+        async def task(format):
+            with settings(format=format):
+                await asyncio.sleep(0.01)
+                return round('1234.5678', '0.0123')
+        async def tasks():
+            return await asyncio.gather(*(task(format) for format in ('Drake', 'PDG', 'French', 'English')))
+        self.assertEqual(asyncio.run(tasks()), ['1 234.568(12)', '1234.568 ± 0.012', '1 234,568 ± 0,012', '1,234.57 ± 0.01'])
+        self.assertRaises(TypeError, settings, sigfigs=3)
+        for kwargs in ({'sep': tuple}, {'sep': list}, {'sep': 'tuple'}, {'separator': 'list'}, {'format': float}, {'style': str},
+                       {'format': 'map'}, {'format': 'jablowski'}, {'prefix': 'x'}, {'engine': 'fast'}):
+            self.assertRaises(ValueError, settings, **kwargs)
+        for kwargs in ({'cutoff': 'x'}, {'cutoff': 29.5}, {'crop': None}):
+            self.assertRaises(TypeError, settings, **kwargs)
+        with settings(format='+-', notation='sci', cutoff=29, prefix='eng', engine='decimal'):
+            self.assertEqual(round('1.2345', '0.0234'), round('1.2345', '0.0234', format='+-', notation='sci', cutoff=29, prefix='eng', engine='decimal'))
+        resetwarnings()
+
+class TestFastPaths(unittest.TestCase):
+    '''Compares numeric inputs parsed & output directly with the same numbers via their string representation'''
+    def runTest(self):
+        rng = default_rng(2718)
+        floats = rng.standard_normal(3000) * 10.0**rng.integers(-30, 30, 3000)
+        inputs = [float(x) for x in floats] + [0.0, -0.0, 5e-324, 1.7976931348623157e308]
+        inputs += [int(x) for x in rng.integers(-10**18, 10**18, 1000)] + [0, -7, 10**300]
+        inputs += [Decimal(repr(float(x))) for x in floats[:1000]] + [Decimal('-0.000'), Decimal('12E+3'), Decimal('1.2300')]
+        inputs += [x for dtype in (float64, float32, float16) for x in floats[:1000].astype(dtype) if not isinf(x)]
+        inputs += list(rng.integers(-10**9, 10**9, 1000).astype(int64)) + list(rng.integers(-10**9, 10**9, 1000).astype(int32))
+        for x in inputs:
+            fast, slow = _num_parse(x), _num_parse(str(x))
+            self.assertEqual((fast.map, fast.sign, fast.zero), (slow.map, slow.sign, slow.zero), repr(x))
+            text = f"{slow.sign}{''.join(map(str, reversed(slow.map.values())))}E{slow.min_power()}"
+            for output_type in (float, int, Decimal, str):
+                expected = int(float(text)) if output_type == int else output_type(text)
+                result = fast.output(output_type)
+                self.assertEqual((result, type(result)), (expected, output_type), repr(x))
+            self.assertEqual(signbit(fast.output(float)), signbit(float(text)), repr(x))
+        for x, expected in ((int64(1907123), int64(1907000)), (int32(-12), int32(-12)), (float32(0.1234567), float32(0.1235))):
+            self.assertEqual((round(x, sigfigs=4), type(round(x, sigfigs=4))), (expected, type(expected)))
+        for kwargs in ({'sigfigs': 2}, {'decimals': 2}, {'decimals': -1}):
+            self.assertEqual(round(_num_parse('-2.675'), **kwargs).map, round('-2.675', output='map', **kwargs).map)
+
+class TestNumberCopy(unittest.TestCase):
+    '''Checks _Number.copy() is independent of the original & chained output='map' rounding matches rounding strings'''
+    def runTest(self):
+        from copy import copy, deepcopy
+        filterwarnings("ignore")
+        for text in ('-123.456789E-7', '0.000', '9.995', nan, '1E999'):
+            number = _num_parse(text)
+            for duplicate in (number.copy(), copy(number), deepcopy(number), _num_parse(number)):
+                self.assertEqual([getattr(duplicate, name) for name in type(number).__slots__ if name != 'nan_value'],
+                                 [getattr(number, name) for name in type(number).__slots__ if name != 'nan_value'])
+                self.assertIsNot(duplicate.digits, number.digits)
+                duplicate.round_by_decimals(-duplicate.max_power())
+                duplicate.set_sign('-')
+                self.assertEqual((number.map, number.negative), (_num_parse(text).map, _num_parse(text).negative))
+        for text in ('3.14159265358979', '-0.000271828182', '99999.5'):
+            chained = round(text, sigfigs=12, output='map')
+            for sigfigs in (9, 6, 3):
+                before = chained.map
+                rounded = round(chained, sigfigs=sigfigs, output='map')
+                self.assertEqual(chained.map, before)
+                chained = rounded
+                self.assertEqual(chained.map, round(round(text, sigfigs=12), sigfigs=sigfigs, output='map').map)
+        resetwarnings()
+
+class TestEngines(unittest.TestCase):
+    '''Compares round() output & warnings of the decimal engine with the _Number engine on fuzzed numbers & options'''
+    def runTest(self):
+        rng = default_rng(1729)
+        def number():
+            digits = ''.join(str(d) for d in rng.integers(0, 10, rng.integers(1, 12)))
+            point = rng.integers(0, len(digits) + 1)
+            text = f"{rng.choice(['', '-', '+'])}{digits[:point]}.{digits[point:]}E{rng.integers(-30, 30)}"
+            return Decimal(text) if rng.integers(4) == 0 else text
+        options = [{'sigfigs': 1}, {'sigfigs': 3}, {'sigfigs': 12}, {'decimals': 0}, {'decimals': 2}, {'decimals': -3},
+                   {'decimals': 25}, {'format': 'Drake'}, {'format': 'PDG'}, {'cutoff': 99}, {'cutoff': 355, 'sep': tuple},
+                   {'sigfigs': 4, 'type': Decimal}, {'decimals': 3, 'type': float}, {'prefix': True}]
+        def run(*args, **kwargs):
+            with catch_warnings(record=True) as caught:
+                simplefilter('always')
+                result = round(*args, **kwargs)
+            return result, [str(w.message) for w in caught]
+        for i in range(3000):
+            kwargs = dict(options[rng.integers(len(options))])
+            args = (number(),)
+            if not {'sigfigs', 'decimals'} & set(kwargs):
+                uncertainty = number()
+                args += (uncertainty.copy_abs() if type(uncertainty) == Decimal else uncertainty.lstrip('+-'),)
+            self.assertEqual(run(*args, engine='decimal', **kwargs), run(*args, **kwargs), (args, kwargs))
+        for args in (('2.675',), ('-0.0',), (Decimal('NaN'),), ('1D3',), (2.675,), ('0.004', '0'), ('9.996', '0.0996')):
+            self.assertEqual(run(*args, sigfigs=2, engine='decimal'), run(*args, sigfigs=2), args)
+            self.assertEqual(run(*args, decimals=2, engine='decimal'), run(*args, decimals=2), args)
+
+class TestFormatter(unittest.TestCase):
+    '''Compares compiled formatter output with digit by digit formatting, along with formatter sharing'''
+    def runTest(self):
+        rng = default_rng(1618)
+        for _ in range(3000):
+            num = _num_parse(f"{rng.choice(['', '-'])}{rng.integers(0, 10**int(rng.integers(1, 12)))}E{rng.integers(-14, 14)}")
+            format = {'spacing': [0, .1, 1, 2, 3, 4, 5][rng.integers(7)], 'spacer': str(rng.choice([',', ' ', '_'])), 'decimal': str(rng.choice(['.', ','])), }
+            zeropadding, sign = bool(rng.integers(2)), bool(rng.integers(2))
+            top, bot = num.max_power(), num.min_power()
+            if zeropadding:
+                top, bot = max(top, 0), min(bot, 0)
+            if num.zero and top > 0:
+                top = 0
+            expected = '-' if sign and num.negative else ''
+            for p in range(top, bot - 1, -1):
+                expected += str(num.digit(p) or 0)
+                if p == 0 and bot < 0:
+                    expected += format['decimal']
+                elif format['spacing'] == int(format['spacing']) and format['spacing'] and p % format['spacing'] == 0 and p > bot:
+                    expected += format['spacer']
+            self.assertEqual(num.decimate(format, zeropadding=zeropadding, sign=sign), expected, (num.map, format, zeropadding, sign))
+        self.assertEqual(round('123456.789099', '-1.15E-4', format='Drake'), '123 456.789 10(12)')
+        self.assertEqual(round('1234567', '12000', format='Drake'), '1 235(12) 000')
+        self.assertEqual(round('-0.001234567', '0.0000012', spacing=2, spacer='_', decimal=','), '-0,00_12_35 ± 0,00_00_01')
+        drake = _options_parse(str, (), {'format': 'Drake'})['formatter']
+        self.assertIs(_options_parse(float, ('0.1',), {'format': 'Drake'})['formatter'], drake)
+        self.assertIsNot(_options_parse(str, (), {'format': 'Drake', 'sep': 'external_brackets'})['formatter'], drake)
+
+class TestCache(unittest.TestCase):
+    '''Compares cached round() with uncached round(), along with cache statistics, eviction & result sharing'''
+    def __init__(self, calls):
+        super(TestCache, self).__init__()
+        self.calls = calls
+    def runTest(self):
+        filterwarnings("ignore")
+        calls = self.calls + [((0.0,), {'decimals': 1}), ((-0.0,), {'decimals': 1}), ((Decimal('1.0'),), {}), ((Decimal('1.00'),), {}),
+                  ((1,), {'sigfigs': 2}), ((1.0,), {'sigfigs': 2}), (('1',), {'sigfigs': 2})]
+        expected = [(round(*args, **kwargs), type(round(*args, **kwargs))) for args, kwargs in calls]
+        resetwarnings()
+        try:
+            set_cache(64)
+            for _ in range(2):
+                filterwarnings("ignore")
+                self.assertEqual([(round(*args, **kwargs), type(round(*args, **kwargs))) for args, kwargs in calls], expected)
+                resetwarnings()
+            info = cache_info()
+            self.assertTrue(info.hits > 0 and info.misses > 0)
+            self.assertEqual((info.maxsize, info.currsize), (64, 64))
+            cache_clear()
+            self.assertEqual(cache_info(), (0, 0, 64, 0))
+            round('1.23', sigfigs=2)
+            round('4.56', sigfigs=2)
+            round('1.23', sigfigs=2)
+            set_cache(1)
+            round('1.23', sigfigs=2)
+            self.assertEqual(cache_info(), (2, 2, 1, 1))
+            first = round('3.14159', sigfigs=3, output='map')
+            first.increment_power_by(5)
+            self.assertEqual(round('3.14159', sigfigs=3, output='map').map, {-2: 4, -1: 1, 0: 3})
+            self.assertWarns(UserWarning, round, '12', sigfigs=5)
+            self.assertWarns(UserWarning, round, '12', sigfigs=5)
+            round('1.23', sigfigs=2)
+            self.assertWarns(UserWarning, round, '1.23', sigfigs=2.0)
+            round('1.23', '0.0456', cutoff=35)
+            self.assertWarns(UserWarning, round, '1.23', '0.0456', cutoff=Decimal('35'))
+            self.assertRaises(ValueError, set_cache, -1)
+        finally:
+            set_cache(0)
+            cache_clear()
+
+class TestInstrument(unittest.TestCase):
+    '''Compares round() output with & without instrument() & checks the recorded stats, per thread'''
+    def runTest(self):
+        import sigfig as module
+        calls = [(('123456.789099', '-1.15E-4'), {'format': 'Drake'}), ((2.675,), {'sigfigs': 2, 'prefix': True}),
+                 (('12',), {'sigfigs': 5, 'warn': 'suppress'}), ((Decimal('3.14159'),), {'decimals': 2, 'engine': 'decimal'}), ((1234,), {'notation': 'sci'})]
+        originals = module._num_parse, module._Number.round_by_decimals, module._Formatter.__call__, module.warn
+        expected = [round(*args, **kwargs) for args, kwargs in calls]
+        stats(clear=True)
+        instrument()
+        instrument()
+        self.assertEqual([round(*args, **kwargs) for args, kwargs in calls], expected)
+        snapshot = stats(clear=True)
+        self.assertTrue(snapshot['enabled'])
+        self.assertEqual(snapshot['inputs'], {'str': 2, 'float': 1, 'Decimal': 1, 'int': 1})
+        self.assertEqual(snapshot['modes'], {'uncertainty': 1, 'sigfigs': 2, 'decimals': 1, 'none': 1})
+        self.assertEqual(snapshot['warnings'], {'PRECISION': 1})
+        self.assertEqual({stage: values['calls'] for stage, values in snapshot['stages'].items()},
+                         {'arguments_parse': 5, 'num_parse': 5, 'round': 5, 'round_by_decimals': 4, 'prefixify': 2, 'decimate': 4, 'output': 5})
+        self.assertTrue(all(values['ns'] > 0 for values in snapshot['stages'].values()))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: [round('1234.5678', sigfigs=3) for _ in range(100)], range(8)))
+        snapshot = stats()
+        self.assertEqual((snapshot['inputs'], snapshot['modes'], snapshot['stages']['round']['calls']), ({'str': 800}, {'sigfigs': 800}, 800))
+        instrument(False)
+        self.assertEqual((module._num_parse, module._Number.round_by_decimals, module._Formatter.__call__, module.warn), originals)
+        round('2.675', sigfigs=2)
+        self.assertEqual(stats(clear=True)['stages']['round']['calls'], 800)
+        self.assertFalse(stats()['enabled'])
+
+class TestWarningPolicy(unittest.TestCase):
+    '''Compares warnings collected, counted & suppressed by each warning policy with those issued'''
+    def runTest(self):
+        calls = [(('12',), {'sigfigs': 5}), (('',), {}), ((None, 2), {}), (('1.2',), {'sigfigs': 1}), (('1E',), {})]
+        with catch_warnings(record=True) as issued:
+            simplefilter('always')
+            expected = [round(*args, **kwargs) for args, kwargs in calls]
+        self.assertEqual(len(issued), 5)
+        self.assertTrue(all(w.filename == __file__ for w in issued))
+        messages = [str(w.message) for w in issued]
+        with catch_warnings(record=True) as withheld:
+            simplefilter('always')
+            with warning_policy('collect') as diagnostics:
+                self.assertEqual([round(*args, **kwargs) for args, kwargs in calls], expected)
+                self.assertEqual([Rounder(**kwargs)(*args) for args, kwargs in calls], expected)
+                with warning_policy('count') as counted:
+                    self.assertEqual([round(*args, **kwargs) for args, kwargs in calls], expected)
+                self.assertEqual([round(*args, warn='suppress', **kwargs) for args, kwargs in calls], expected)
+            self.assertEqual([Rounder(warn='suppress', **kwargs)(*args) for args, kwargs in calls], expected)
+            try:
+                everywhere = set_warning_policy('count')
+                self.assertEqual([round(*args, **kwargs) for args, kwargs in calls], expected)
+                self.assertEqual([round(*args, warn='collect', **kwargs) for args, kwargs in calls], expected)
+                self.assertEqual(everywhere.counts, {UserWarning: 5})
+                self.assertEqual([str(w) for w in everywhere.warnings], messages)
+            finally:
+                set_warning_policy('default')
+                everywhere.clear()
+        self.assertEqual(withheld, [])
+        self.assertEqual([str(w) for w in diagnostics.warnings], messages * 2)
+        self.assertEqual(counted.counts, {UserWarning: 5})
+        self.assertRaises(ValueError, set_warning_policy, 'loud')
+        self.assertRaises(ValueError, warning_policy, 'loud')
+        with warning_policy('collect') as ordered:
+            round('E', sigfigs=0, cutoff=3)
+            round(None, '', crop=5)
+        self.assertEqual([str(w) for w in ordered.warnings],
+                         ['no number provided, assuming zero (0)', 'exponent expected but not provided', 'cannot have less that 1 significant figure, setting to 1',
+                          'cutoff/crop cannot be < 9, setting to 9', 'no number provided, assuming zero (0)', 'no number provided, assuming zero (0)',
+                          'cutoff/crop cannot be < 9, setting to 9'])
+        async def collecting():
+            diagnostics = set_warning_policy('collect')
+            with warning_policy('count') as counted:
+                await asyncio.sleep(0.01)
+                round('12', sigfigs=5)
+            round('12', sigfigs=5)
+            results, codes = await round_many_async(['12', '1'], sigfigs=5)
+            await round_many_async(['1'], sigfigs=0)
+            return diagnostics, counted.counts, codes.tolist()
+        async def default():
+            await asyncio.sleep(0)
+            with catch_warnings(record=True) as issued:
+                simplefilter('always')
+                round('12', sigfigs=5)
+                await asyncio.sleep(0.02)
+                round('1', sigfigs=5)
+            return issued
+        async def tasks():
+            return await asyncio.gather(collecting(), default())
+        (diagnostics, counts, codes), issued = asyncio.run(tasks())
+        self.assertEqual([str(w) for w in diagnostics.warnings], [messages[0], 'cannot have less that 1 significant figure, setting to 1'])
+        self.assertEqual(counts, {UserWarning: 1})
+        self.assertEqual(codes, [Status.PRECISION, Status.PRECISION])
+        self.assertEqual(len(issued), 2)
+        with catch_warnings(record=True) as issued:
+            simplefilter('always')
+            round('12', sigfigs=5)
+        self.assertEqual(len(issued), 1)
+
+class TestMany(unittest.TestCase):
+    '''Compares round_many() results & status codes with element by element round()'''
+    def runTest(self):
+        values = ['2.675', 'x', None, 0.0314159, float('nan'), [1], '', Decimal('-1.50'), 12, '1E', '1.2.3', -12.5, 'inf']
+        statuses = [Status.OK, Status.INVALID, Status.MISSING, Status.OK, Status.NAN, Status.UNSUPPORTED, Status.MISSING,
+                    Status.OK, Status.OK, Status.WARNING, Status.INVALID, Status.OK, Status.INVALID]
+        for kwargs in ({'sigfigs': 2}, {'decimals': 1}, {'uncertainty': '0.0123', 'format': 'Drake'}):
+            expected = []
+            filterwarnings("ignore")
+            for value, status in zip(values, statuses):
+                if status in {Status.INVALID, Status.UNSUPPORTED}:
+                    self.assertRaises((ValueError, TypeError), round, value, **kwargs)
+                    expected.append(None)
+                else:
+                    expected.append(round(value, **kwargs))
+            resetwarnings()
+            with catch_warnings(record=True) as issued:
+                simplefilter('always')
+                results, codes = round_many(iter(values), **kwargs)
+            self.assertEqual(issued, [])
+            self.assertEqual(len(results), len(codes))
+            self.assertEqual([str(r) for r in results], [str(r) for r in expected])
+            self.assertEqual(list(codes), statuses)
+            coerced = round_many(values, errors='coerce', **kwargs)[0]
+            self.assertTrue(all(isnan(c) for c, r in zip(coerced, expected) if r is None))
+        self.assertEqual(round_many(['12', '3.1'], sigfigs=3)[1].tolist(), [Status.PRECISION, Status.PRECISION])
+        self.assertRaises(ValueError, round_many, ['1', 'x'], errors='raise')
+        self.assertRaises(TypeError, round_many, ['1', [1]], errors='raise')
+        self.assertEqual(round_many([10**400, '1.5'], sigfigs=2), ([None, '1.5'], pyarray('B', [Status.INVALID, Status.OK])))
+        self.assertRaises(OverflowError, round_many, [10**400], sigfigs=2, errors='raise')
+        self.assertRaises(ValueError, round_many, ['1'], errors='ignore')
+        self.assertWarns(UserWarning, round_many, ['1'], sigfigs=0)
+        self.assertEqual(round_many([]), ([], pyarray('B')))
+
+class TestIter(unittest.TestCase):
+    '''Compares round_iter() output with element by element round() for scalar, NumPy & unbounded inputs'''
+    def runTest(self):
+        rng = default_rng(1618)
+        floats = rng.standard_normal(1000) * 10.0**rng.integers(-8, 8, 1000)
+        uncertainties = [str(u) for u in abs(rng.standard_normal(1000))]
+        filterwarnings("ignore")
+        for values in ([str(x) for x in floats], [float(x) for x in floats], list(floats), list(floats.astype(float32)),
+                       list(rng.integers(-10**6, 10**6, 1000)), [float(x) for x in floats[:500]] + list(floats[500:])):
+            for kwargs in ({'sigfigs': 3}, {'decimals': 2}, {'d': -1}, {'sigfigs': 2, 'notation': 'sci'}):
+                expected = [round(x, **kwargs) for x in values]
+                results = list(round_iter(iter(values), chunksize=300, **kwargs))
+                self.assertEqual(results, expected)
+                self.assertEqual([type(r) for r in results], [type(r) for r in expected])
+            self.assertEqual(list(round_iter(values, uncertainties, format='Drake')),
+                             [round(x, u, format='Drake') for x, u in zip(values, uncertainties)])
+        chunks = [floats[i:i+100] for i in range(0, 1000, 100)]
+        for result, chunk in zip(round_iter(chunks, sigfigs=3), chunks):
+            self.assertEqual(result.tolist(), [round(x, sigfigs=3) for x in chunk])
+        resetwarnings()
+        self.assertEqual(list(islice(round_iter(count(), decimals=-1), 3, 6)), [0, 0, 10])
+        rounded = round_iter(array([2.675, 0.125, float('inf')]), decimals=2, chunksize=2)
+        self.assertEqual([next(rounded), next(rounded), next(rounded)], [2.68, 0.13, float('inf')])
+        rounded = round_iter([10**400, '1.5', 'x', [1]], sigfigs=2)
+        self.assertRaises(OverflowError, next, rounded)
+        self.assertEqual(list(round_iter([10**400, '1.5', 'x', [1]], errors='mask', sigfigs=2)), [None, '1.5', None, None])
+        self.assertEqual(list(round_iter([uint8(250), uint8(5)], errors='mask', sigfigs=1)), [None, uint8(5)])
+        coerced = list(round_iter(['1.5', '2.5'], ['0.1', 'x'], errors='coerce'))
+        self.assertEqual(coerced[0], '1.5 ± 0.1')
+        self.assertTrue(isnan(coerced[1]))
+        self.assertRaises(ValueError, list, round_iter(['1'], errors='ignore'))
+
+class TestParallel(unittest.TestCase):
+    '''Compares round_parallel() across processes & in process with element by element round()'''
+    def runTest(self):
+        rng = default_rng(1414)
+        values = [str(x) for x in rng.standard_normal(12000) * 10.0**rng.integers(-6, 6, 12000)]
+        uncertainties = [str(u) for u in abs(rng.standard_normal(12000))]
+        filterwarnings("ignore")
+        self.assertEqual(round_parallel(values, workers=2, sigfigs=3), [round(x, sigfigs=3) for x in values])
+        self.assertEqual(round_parallel(iter(values), uncertainties, workers=2, chunksize=5000, format='PDG'),
+                         [round(x, u, format='PDG') for x, u in zip(values, uncertainties)])
+        self.assertEqual(round_parallel(values[:50], uncertainties[:50], workers=4, format='Drake'),
+                         [round(x, u, format='Drake') for x, u in zip(values[:50], uncertainties[:50])])
+        resetwarnings()
+        self.assertEqual(round_parallel([]), [])
+        self.assertRaises(ValueError, round_parallel, values[:5], uncertainties[:4])
+
+class TestAsync(unittest.TestCase):
+    '''Compares round_many_async() & round_iter_async() with round_many() & round_iter() & checks the event loop keeps running'''
+    def runTest(self):
+        rng = default_rng(2236)
+        values = [str(x) for x in rng.standard_normal(3000) * 10.0**rng.integers(-6, 6, 3000)] + ['x', None, 'nan']
+        uncertainties = [str(u) for u in abs(rng.standard_normal(2999))]
+        filterwarnings("ignore")
+        async def source(items):
+            for item in items:
+                await asyncio.sleep(0)
+                yield item
+        async def rounds():
+            self.assertEqual(await round_many_async(values, chunksize=128, sigfigs=3), round_many(values, sigfigs=3))
+            self.assertEqual(await round_many_async(source(values), chunksize=1000, decimals=2), round_many(values, decimals=2))
+            self.assertEqual([r async for r in round_iter_async(source(values), iter(uncertainties), chunksize=500, format='Drake')],
+                             list(round_iter(values, uncertainties, format='Drake')))
+            with settings(format='PDG'), ProcessPoolExecutor(max_workers=2) as pool:
+                self.assertEqual([r async for r in round_iter_async(values[:1000], uncertainties, executor=pool, chunksize=300)],
+                                 list(round_iter(values[:1000], uncertainties)))
+            with self.assertRaises(ValueError):
+                await round_many_async(values, errors='raise')
+            consumed, beats = [], []
+            def endless():
+                for x in count():
+                    consumed.append(x)
+                    yield x * 1.1
+            async def consume():
+                async for _ in round_iter_async(endless(), chunksize=100, prefetch=1, sigfigs=2):
+                    pass
+            async def heartbeat():
+                while True:
+                    beats.append(len(consumed))
+                    await asyncio.sleep(0)
+            beating, consuming = asyncio.ensure_future(heartbeat()), asyncio.ensure_future(consume())
+            await asyncio.sleep(0.1)
+            consuming.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await consuming
+            stopped = len(consumed)
+            await asyncio.sleep(0.05)
+            beating.cancel()
+            self.assertEqual(len(consumed), stopped)
+            self.assertGreater(len(set(beats)), 2)
+        asyncio.run(rounds())
+        resetwarnings()
+        self.assertRaises(ValueError, asyncio.run, round_many_async(values, errors='ignore'))
+        self.assertRaises(ValueError, asyncio.run, round_many_async(values, chunksize=0))
+
+class TestCommandLine(unittest.TestCase):
+    '''Compares files rounded by the command line interface with round() of each selected cell'''
+    def runTest(self):
+        rng = default_rng(1732)
+        rows = [[f'r{i}', str(x), str(u), 'n/a' if i % 7 == 0 else ''] for i, (x, u) in
+                enumerate(zip(rng.standard_normal(300) * 10.0**rng.integers(-5, 5, 300), abs(rng.standard_normal(300))))]
+        rows[3][1] = 'bad'
+        rows[4][1] = ''
+        filterwarnings("ignore")
+        def rounded(x, *args, **kwargs):
+            try:
+                return round(x, *args, **kwargs) if x else x
+            except ValueError:
+                return x
+        with TemporaryDirectory() as tmp:
+            source = Path(tmp) / 'data.tsv'
+            source.write_text('name\tvalue\terror\tnote\n' + ''.join('\t'.join(row) + '\n' for row in rows), encoding='utf-8')
+            for argv, expected in (
+                    (['-c', 'value', '-s', '3'], [[a, rounded(b, sigfigs=3), c, d] for a, b, c, d in rows]),
+                    (['-c', '2', '-d', '1', '--chunksize', '7'], [[a, rounded(b, decimals=1), c, d] for a, b, c, d in rows]),
+                    (['-c', 'value', '-u', 'error', '-f', 'Drake', '-w', '2', '--chunksize', '50'],
+                     [[a, rounded(b, c, format='Drake'), c, d] for a, b, c, d in rows]),
+                    (['-c', 'value', '-u', '3', '--split', '-f', 'PDG'],
+                     [[a, *(rounded(b, c, format='PDG', sep=tuple) if b != 'bad' and b else (b, c)), d] for a, b, c, d in rows])):
+                target = Path(tmp) / 'rounded.tsv'
+                self.assertEqual(main([str(source), '-o', str(target)] + argv), 0)
+                lines = target.read_text(encoding='utf-8').splitlines()
+                self.assertEqual(lines, ['name\tvalue\terror\tnote'] + ['\t'.join(row) for row in expected])
+        resetwarnings()
+        script = subprocess.run([sys.executable, '-m', 'sigfig', '-c', 'x', '-u', 'dx', '--format', 'Drake'], input='x,dx\n123456.789099,-1.15E-4\n',
+                                capture_output=True, text=True, cwd=Path(__file__).parent.parent)
+        self.assertEqual(script.stdout, 'x,dx\n123 456.789 10(12),-1.15E-4\n')
+        self.assertEqual(script.returncode, 0)
+
+class TestImport(unittest.TestCase):
+    '''Checks import sigfig defers all but the modules round() needs (the import time budget is in benchmark.py)'''
+    deferred = {'inspect', 'copy', 'threading', 'numpy', 'asyncio', 'concurrent.futures', 'argparse', 'csv', 'mmap'}
+    def runTest(self):
+        script = subprocess.run([sys.executable, '-c', 'import sys, sigfig; print(*sys.modules)'],
+                                capture_output=True, text=True, cwd=Path(__file__).parent.parent)
+        self.assertEqual(script.returncode, 0, script.stderr)
+        self.assertFalse(self.deferred & set(script.stdout.split()))
+
 class KnownDepr(unittest.TestCase):
     '''Compares each run of round() with expected output for depreciated usages'''
     def __init__(self, func, output):
@@ -132,42 +776,67 @@ class KnownExcp(unittest.TestCase):
 def suite():
     '''Function containing a suite of all test cases for sigfig module'''
     def cases(filename):
-        with open(Path(__file__).parent / filename, newline='') as f:
+        with open(Path(__file__).parent / filename, newline='', encoding='utf-8-sig') as f:
             line = 0
             for case in csv.reader(f, delimiter=';'):
                 line += 1
                 try:
-                    case = [eval(case[0].replace('ï»¿','')),
+                    case = [eval(case[0]),
                             eval(case[1]),
-                            eval(case[2].replace('Â',''))]
-                except:
-                    print('problem on line %d of %s' % (line, filename))
-                    continue
+                            eval(case[2])]
+                except Exception as e:
+                    raise ValueError('problem on line %d of %s' % (line, filename)) from e
                 yield case
     
     suite = unittest.TestSuite()
     eq_cases = cases('test_equality.csv')
     suite.addTests(KnownGood(args, kwargs, output) for args, kwargs, output in eq_cases)
+    suite.addTests(KnownGoodRounder(args, kwargs, output) for args, kwargs, output in cases('test_equality.csv'))
+    suite.addTests(KnownGood(args, dict(kwargs, engine='decimal'), output) for args, kwargs, output in cases('test_equality.csv'))
     class_cases = [[30, 3, True], [1.2, 1, True], [1.0, 1, False], [1, 1.0, False], [1, 1, False]]
     suite.addTests(KnownGrtr(x, y, z) for x, y, z in class_cases)
+    map_cases = [['3.14', {0: 3, -1: 1, -2: 4}], ['-0.0120', {-2: 1, -3: 2, -4: 0}], ['0.00', {0: 0}], ['12E3', {4: 1, 3: 2}]]
+    suite.addTests(KnownMap(x, z) for x, z in map_cases)
     warn_cases = cases('test_warning.csv')
     suite.addTests(KnownWarn(args, kwargs, output) for args, kwargs, output in warn_cases)
+    suite.addTests(KnownWarn(args, dict(kwargs, engine='decimal'), output) for args, kwargs, output in cases('test_warning.csv'))
     warn_loud_cases = cases('test_warn_unmutable.csv')
     suite.addTests(KnownWarnLoud(args, kwargs, output) for args, kwargs, output in warn_loud_cases)
     suite.addTest(TestType())
+    uncertainty_cases = [{}, {'cutoff': 29}, {'cutoff': 99}, {'cutoff': 355}, {'format': 'Drake'}, {'format': 'PDG', 'prefix': True}, {'sep': 'external_brackets'}]
+    suite.addTest(TestArrayBounds())
+    suite.addTest(TestFile())
+    suite.addTest(TestText())
+    suite.addTests(TestUncertaintyArray(dtype, kwargs) for dtype in (float64, float32) for kwargs in uncertainty_cases)
+    suite.addTest(TestThreads())
+    suite.addTest(TestSettings())
+    suite.addTest(TestFastPaths())
+    suite.addTest(TestNumberCopy())
+    suite.addTest(TestFormatter())
+    suite.addTest(TestEngines())
+    suite.addTest(TestWarningPolicy())
+    suite.addTest(TestInstrument())
+    suite.addTest(TestMany())
+    suite.addTest(TestIter())
+    suite.addTest(TestParallel())
+    suite.addTest(TestAsync())
+    suite.addTest(TestCommandLine())
+    suite.addTest(TestImport())
+    suite.addTest(TestCache([(args, kwargs) for args, kwargs, _ in cases('test_equality.csv')]))
     nan_cases = [[(nan, 1), {}], [(nan,), {'d':3}], [(nan,), {'s':4}], [(nan,), {'u':4.0}]]
     suite.addTests(TestNaN(*case) for case in nan_cases)
+    array_cases = [{'sigfigs': 1}, {'sigfigs': 3}, {'sigfigs': 15}, {'decimals': 2}, {'decimals': -2}]
+    suite.addTests(TestArray(dtype, kwargs) for dtype in (float64, float32, float16) for kwargs in array_cases)
     def general_cases(filename):
-        with open(Path(__file__).parent / filename, newline='') as f:
+        with open(Path(__file__).parent / filename, newline='', encoding='utf-8-sig') as f:
             line = 0
             for case in csv.reader(f, delimiter=';'):
                 line += 1
                 try:
-                    case = [case[0].replace('ï»¿',''),
+                    case = [case[0],
                             case[1]]
-                except:
-                    print('problem on line %d of %s' % (line, filename))
-                    continue
+                except Exception as e:
+                    raise ValueError('problem on line %d of %s' % (line, filename)) from e
                 yield case
     depreciated_cases = general_cases('test_depreciated.csv')
     suite.addTests(KnownDepr(func, output) for func, output in depreciated_cases)
@@ -175,8 +844,6 @@ def suite():
     suite.addTests(KnownExcp(func, result) for func, result in exception_cases)
     # test creating _Number instance & setting sign = '*'
     # test warnings for round(decimals=2)
-    # either add a minor_prefixes test or move it to a feature branch
-    # test setting a _manual_settings change or move it to feature branch
     return suite
 
 if __name__ == '__main__':